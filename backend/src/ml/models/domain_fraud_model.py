@@ -16,11 +16,19 @@ try:
     from sklearn.model_selection import train_test_split, cross_val_score
     from sklearn.metrics import accuracy_score, precision_score, recall_score, classification_report
     import numpy as np
+    from joblib import Parallel, delayed
+    from scipy import sparse
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
     print("Warning: scikit-learn not available. Using simple rule-based model.")
 
+# Batches smaller than this are scored on the calling thread
+PARALLEL_PREDICT_MIN_BATCH = 512
+
+# Training matrices below this fraction of nonzeros are fit in CSC form
+SPARSE_TRAINING_MAX_DENSITY = 0.3
+
 class SimpleDomainFraudModel:
     """
     Simple, practical domain fraud detection model.
@@ -33,6 +41,8 @@ class SimpleDomainFraudModel:
         self.model_metadata = {}
         self.is_trained = False
         self.use_sklearn = SKLEARN_AVAILABLE
+        self._flat_forest = None
+        self._top_factors = []
         
         # Rule-based thresholds for fallback
         self.rule_thresholds = {
@@ -50,6 +60,14 @@ class SimpleDomainFraudModel:
             'suspicious_keywords': ['verify', 'secure', 'update', 'suspended', 'urgent', 'bank'],
             'suspicious_registrars': ['freenom', 'unknown registrar', 'privacy protected']
         }
+        self._build_indicator_lookups()
+    
+    def _build_indicator_lookups(self):
+        """Precompute lookup structures derived from fraud_indicators"""
+        self._suspicious_tld_set = frozenset(
+            tld.lstrip('.') for tld in self.fraud_indicators['suspicious_tlds']
+        )
+        self._suspicious_keywords = tuple(self.fraud_indicators['suspicious_keywords'])
     
     def extract_features(self, domain_data: Dict[str, Any]) -> Dict[str, float]:
         """
@@ -103,7 +121,8 @@ class SimpleDomainFraudModel:
         features['subdomain_count'] = max(0, len(parts) - 2)  # Subtract domain and TLD
         
         # Suspicious TLD detection
-        features['has_suspicious_tld'] = float(any(domain.endswith(tld) for tld in self.fraud_indicators['suspicious_tlds']))
+        _, dot, tld = domain.rpartition('.')
+        features['has_suspicious_tld'] = float(bool(dot) and tld in self._suspicious_tld_set)
         
         # Typosquatting detection
         domain_base = parts[0] if parts else domain
@@ -117,7 +136,7 @@ class SimpleDomainFraudModel:
         features['typosquatting_score'] = typosquatting_score
         
         # Suspicious keyword detection
-        keyword_count = sum(1 for keyword in self.fraud_indicators['suspicious_keywords'] if keyword in domain)
+        keyword_count = sum(1 for keyword in self._suspicious_keywords if keyword in domain)
         features['suspicious_keyword_count'] = keyword_count
         
         # Character analysis
@@ -312,7 +331,7 @@ class SimpleDomainFraudModel:
     
     def _train_sklearn_model(self, X: List[List[float]], labels: List[int]) -> Dict[str, Any]:
         """Train using scikit-learn Random Forest"""
-        X = np.array(X)
+        X = self._build_training_matrix(X)
         y = np.array(labels)
         
         # Split data for validation
@@ -323,10 +342,13 @@ class SimpleDomainFraudModel:
             n_estimators=100,
             max_depth=10,
             random_state=42,
-            class_weight='balanced'  # Handle imbalanced data
+            class_weight='balanced',  # Handle imbalanced data
+            n_jobs=-1
         )
         
         self.model.fit(X_train, y_train)
+        self._flatten_forest()
+        self._index_top_features()
         
         # Evaluate model
         y_pred = self.model.predict(X_test)
@@ -347,7 +369,7 @@ class SimpleDomainFraudModel:
         self.is_trained = True
         self.model_metadata = {
             'model_type': 'RandomForest',
-            'training_samples': len(X),
+            'training_samples': X.shape[0],
             'features_count': len(self.feature_names),
             'trained_at': datetime.now().isoformat()
         }
@@ -366,6 +388,36 @@ class SimpleDomainFraudModel:
         print(f"Model trained successfully: Accuracy={accuracy:.3f}, Precision={precision:.3f}, Recall={recall:.3f}")
         return metrics
     
+    def _build_training_matrix(self, rows: List[List[float]]):
+        """
+        Build the training matrix, as float64 like np.array(rows) did.
+        Domains with missing WHOIS/SSL/DNS/reputation data default to zeros, so
+        when fewer than SPARSE_TRAINING_MAX_DENSITY of the entries are nonzero
+        the matrix is packed straight from each row's nonzeros into CSC form,
+        without a dense copy; otherwise it is built as a dense ndarray.
+        """
+        n_rows = len(rows)
+        n_features = len(self.feature_names)
+        nnz = sum(len(row) - row.count(0) for row in rows)
+        
+        if not n_rows or nnz >= SPARSE_TRAINING_MAX_DENSITY * n_rows * n_features:
+            return np.asarray(rows, dtype=np.float64)
+        
+        data = np.empty(nnz, dtype=np.float64)
+        indices = np.empty(nnz, dtype=np.int32)
+        indptr = np.empty(n_rows + 1, dtype=np.int64)
+        indptr[0] = 0
+        end = 0
+        for i, row in enumerate(rows):
+            values = np.asarray(row, dtype=np.float64)
+            cols = np.flatnonzero(values)
+            start, end = end, end + len(cols)
+            data[start:end] = values[cols]
+            indices[start:end] = cols
+            indptr[i + 1] = end
+        
+        return sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_features)).tocsc()
+    
     def _train_rule_based_model(self, training_data: List[Dict[str, Any]], labels: List[int]) -> Dict[str, Any]:
         """Train using rule-based approach (fallback)"""
         print("Training rule-based model (sklearn not available)...")
@@ -437,34 +489,137 @@ class SimpleDomainFraudModel:
         except Exception as e:
             return 0.5, 0.0, {'error': f'Prediction error: {str(e)}'}
     
+    def predict_batch(self, domain_data_list: List[Dict[str, Any]]) -> List[Tuple[float, float, Dict[str, Any]]]:
+        """
+        Predict fraud probability for many domains at once.
+        Returns one (fraud_probability, confidence, explanation) tuple per domain.
+        """
+        if not self.is_trained:
+            return [(0.5, 0.0, {'error': 'Model not trained'}) for _ in domain_data_list]
+        
+        if not (self.use_sklearn and self.model is not None):
+            return [self.predict(domain_data) for domain_data in domain_data_list]
+        
+        try:
+            feature_rows = [self.extract_features(domain_data) for domain_data in domain_data_list]
+            feature_array = np.array([[features.get(name, 0) for name in self.feature_names]
+                                      for features in feature_rows])
+            fraud_probs = self._predict_proba_parallel(feature_array)
+        except Exception as e:
+            return [(0.5, 0.0, {'error': f'Prediction error: {str(e)}'}) for _ in domain_data_list]
+        
+        return [
+            self._build_sklearn_prediction(features, float(fraud_prob))
+            for features, fraud_prob in zip(feature_rows, fraud_probs)
+        ]
+    
     def _predict_sklearn(self, features: Dict[str, float]) -> Tuple[float, float, Dict[str, Any]]:
         """Make prediction using sklearn model"""
         # Convert features to array in correct order
         feature_array = np.array([[features.get(name, 0) for name in self.feature_names]])
         
         # Get prediction probability
-        fraud_prob = self.model.predict_proba(feature_array)[0][1]
+        fraud_prob = float(self._predict_proba_flat(feature_array)[0])
         
+        return self._build_sklearn_prediction(features, fraud_prob)
+    
+    def _build_sklearn_prediction(self, features: Dict[str, float], fraud_prob: float) -> Tuple[float, float, Dict[str, Any]]:
+        """Attach confidence and explanation to a sklearn fraud probability"""
         # Calculate confidence based on how far from decision boundary
         confidence = abs(fraud_prob - 0.5) * 2
         
-        # Get feature importance for explanation
-        feature_importance = dict(zip(self.feature_names, self.model.feature_importances_))
-        top_factors = sorted(
-            [(name, features[name], importance) for name, importance in feature_importance.items()],
-            key=lambda x: x[2], reverse=True
-        )[:5]
-        
         explanation = {
             'model_type': 'sklearn_random_forest',
             'top_risk_factors': [
-                {'feature': name, 'value': value, 'importance': importance}
-                for name, value, importance in top_factors
+                {'feature': name, 'value': features[name], 'importance': importance}
+                for name, importance in self._top_factors
             ]
         }
         
         return fraud_prob, confidence, explanation
     
+    def _index_top_features(self):
+        """Precompute the five most important features used in every explanation"""
+        importances = self.model.feature_importances_
+        top_idx = np.argsort(-importances, kind='stable')[:5]
+        self._top_factors = [(self.feature_names[i], importances[i]) for i in top_idx]
+    
+    def _flatten_forest(self):
+        """
+        Pack every tree of the trained forest into one set of contiguous node arrays.
+        Child indices are rebased to global offsets so a single traversal loop can
+        walk all trees without touching the per-tree sklearn structures.
+        """
+        self._flat_forest = None
+        if self.model is None or 1 not in self.model.classes_:
+            return
+        
+        fraud_class = int(np.searchsorted(self.model.classes_, 1))
+        features, thresholds, lefts, rights, values, roots = [], [], [], [], [], []
+        offset = 0
+        max_depth = 0
+        
+        for estimator in self.model.estimators_:
+            tree = estimator.tree_
+            is_leaf = tree.children_left == -1
+            leaf_values = tree.value[:, 0, :]
+            totals = leaf_values.sum(axis=1)
+            totals[totals == 0] = 1.0
+            
+            roots.append(offset)
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.int32))
+            thresholds.append(tree.threshold.astype(np.float64))
+            # Leaves point at themselves so extra traversal steps are no-ops
+            node_ids = np.arange(tree.node_count, dtype=np.int32) + offset
+            lefts.append(np.where(is_leaf, node_ids, tree.children_left + offset).astype(np.int32))
+            rights.append(np.where(is_leaf, node_ids, tree.children_right + offset).astype(np.int32))
+            values.append((leaf_values[:, fraud_class] / totals).astype(np.float64))
+            offset += tree.node_count
+            max_depth = max(max_depth, tree.max_depth)
+        
+        self._flat_forest = {
+            'feature': np.concatenate(features),
+            'threshold': np.concatenate(thresholds),
+            'left': np.concatenate(lefts),
+            'right': np.concatenate(rights),
+            'value': np.concatenate(values),
+            'roots': np.array(roots, dtype=np.int32),
+            'max_depth': max_depth
+        }
+    
+    def _predict_proba_flat(self, X: "np.ndarray") -> "np.ndarray":
+        """Fraud-class probability for each row of X using the flattened forest"""
+        forest = self._flat_forest
+        if forest is None:
+            return self.model.predict_proba(X)[:, list(self.model.classes_).index(1)]
+        
+        # sklearn compares float32 inputs against float64 thresholds
+        X = np.asarray(X, dtype=np.float32)
+        n_samples = X.shape[0]
+        rows = np.arange(n_samples)[:, None]
+        idx = np.broadcast_to(forest['roots'], (n_samples, forest['roots'].shape[0])).copy()
+        
+        feature, threshold = forest['feature'], forest['threshold']
+        left, right = forest['left'], forest['right']
+        for _ in range(forest['max_depth']):
+            go_left = X[rows, feature[idx]] <= threshold[idx]
+            idx = np.where(go_left, left[idx], right[idx])
+        
+        return forest['value'][idx].mean(axis=1)
+    
+    def _predict_proba_parallel(self, X: "np.ndarray") -> "np.ndarray":
+        """Shard a large batch across threads; NumPy releases the GIL during traversal"""
+        n_jobs = os.cpu_count() or 1
+        if n_jobs == 1 or len(X) < PARALLEL_PREDICT_MIN_BATCH:
+            return self._predict_proba_flat(X)
+        
+        bounds = np.linspace(0, len(X), n_jobs + 1, dtype=int)
+        chunks = Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(self._predict_proba_flat)(X[start:end])
+            for start, end in zip(bounds[:-1], bounds[1:]) if end > start
+        )
+        return np.concatenate(chunks)
+    
     def _predict_rule_based(self, features: Dict[str, float], domain_data: Dict[str, Any]) -> Tuple[float, float, Dict[str, Any]]:
         """Make prediction using rule-based approach"""
         risk_score = 0.0
@@ -558,6 +713,10 @@ class SimpleDomainFraudModel:
         self.use_sklearn = model_data.get('use_sklearn', SKLEARN_AVAILABLE)
         self.rule_thresholds = model_data.get('rule_thresholds', self.rule_thresholds)
         self.fraud_indicators = model_data.get('fraud_indicators', self.fraud_indicators)
+        self._build_indicator_lookups()
+        if self.use_sklearn and self.model is not None:
+            self._flatten_forest()
+            self._index_top_features()
         
         print(f"Model loaded from: {filepath}")
 
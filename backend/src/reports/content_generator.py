@@ -5,18 +5,414 @@ AI-powered content generation system for professional investigation reports
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Callable, Iterable, Iterator, Optional, Tuple
+from bisect import bisect_right
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate, islice
 from pathlib import Path
+from types import MappingProxyType
 import re
 import statistics
+import sys
+import textwrap
+import time
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+_BULLET_GLYPH = sys.intern("•")
+_BULLET = sys.intern(_BULLET_GLYPH + " ")
+_PROFESSIONAL_HEADER = sys.intern("ANALYTICAL ASSESSMENT - ")
+_FORENSIC_HEADER = sys.intern("FORENSIC ANALYSIS - ")
+
+# Fixed prose for the professional and forensic analyses, shared across calls
+_PROFESSIONAL_METHODOLOGY = (
+    " data employed multiple verification methodologies and cross-source validation protocols. "
+    "The following findings represent the most significant discoveries:\n\n"
+)
+_PROFESSIONAL_RISK_INTRO = " risk factors requiring detailed evaluation and potential mitigation measures:\n\n"
+_PROFESSIONAL_RISK_CLOSING = (
+    "\nThe presence of these risk factors suggests enhanced monitoring "
+    "and additional verification procedures may be warranted."
+)
+_PROFESSIONAL_NO_RISK_CLOSING = (
+    " category. This finding supports a lower risk classification for this analytical domain."
+)
+_FORENSIC_METHODOLOGY = (
+    " data was conducted using established investigative protocols with appropriate "
+    "documentation of evidence chain and source verification.\n\nFINDINGS:\n"
+)
+_FORENSIC_FINDING_NOTES = "\n  Source: Verified through authoritative database\n  Confidence: High\n\n"
+_FORENSIC_INDICATOR_NOTES = "\n  Classification: Requires investigation\n  Evidence Status: Documented\n\n"
+_FORENSIC_RISK_INTRO = (
+    " risk indicators that warrant detailed examination and potential investigative follow-up:\n\n"
+)
+_FORENSIC_RISK_OPINION = (
+    "EXPERT OPINION: The presence of documented risk indicators suggests that additional "
+    "investigative measures and enhanced due diligence procedures are recommended."
+)
+_FORENSIC_NO_RISK_OPINION = (
+    " category.\n\nEXPERT OPINION: The absence of significant risk indicators supports "
+    "a favorable assessment in this investigative domain."
+)
+
+_WS_RE = re.compile(r'\s+')
+_SENTENCE_RE = re.compile(r'(?<=[.!?])\s+')
+# Substring match, case-insensitive: 'Risky' and 'FRAUDULENT' both count
+_NEGATIVE_KEYWORD_RE = re.compile(r'suspicious|risk|threat|violation|fraud|illegal', re.IGNORECASE)
+# String values that carry no information and are left out of section findings
+_PLACEHOLDER_VALUES = frozenset({'', 'Unknown', 'Not available', 'Not checked'})
+# Raw section values carried through to generated sections as-is
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+@lru_cache(maxsize=256)
+def _pretty_key(key: str) -> str:
+    """Turn a snake_case data key into a display label"""
+    return key.replace('_', ' ').title()
+
+def _text_finding(key: str, value: str) -> Tuple[str, ...]:
+    """Report a string field unless it is a placeholder"""
+    return () if value in _PLACEHOLDER_VALUES else (f"{_pretty_key(key)}: {value}",)
+
+def _number_finding(key: str, value: float) -> Tuple[str, ...]:
+    """Report a positive numeric field"""
+    return (f"{_pretty_key(key)}: {value}",) if value > 0 else ()
+
+def _list_finding(key: str, value: list) -> Tuple[str, ...]:
+    """Report the item count of a non-empty list"""
+    return (f"{_pretty_key(key)}: {len(value)} items",) if value else ()
+
+def _nested_findings(key: str, value: dict) -> Iterator[str]:
+    """Lazily report the known string fields of a nested dictionary"""
+    return (f"{_pretty_key(sub_key)}: {sub_value}" for sub_key, sub_value in value.items()
+            if isinstance(sub_value, str) and sub_value and sub_value != 'Unknown')
+
+# Section findings are dispatched on the exact value type; bool keeps its int behaviour
+_FINDING_HANDLERS = {
+    str: _text_finding,
+    int: _number_finding,
+    float: _number_finding,
+    bool: _number_finding,
+    list: _list_finding,
+    dict: _nested_findings
+}
+# Checked in order for subclasses (str enums, defaultdict, ...) missing from the table
+_FINDING_HANDLER_BASES = (
+    (str, _text_finding),
+    ((int, float), _number_finding),
+    (list, _list_finding),
+    (dict, _nested_findings)
+)
+
+def _subclass_finding_handler(value: Any) -> Optional[Callable[[str, Any], Iterable[str]]]:
+    """Find the handler for a value whose exact type is not in the dispatch table"""
+    for base, handler in _FINDING_HANDLER_BASES:
+        if isinstance(value, base):
+            return handler
+    return None
+
+@lru_cache(maxsize=1)
+def _timestamp_for_tick(tick: int) -> str:
+    """Wall-clock timestamp shared by every report generated within one tick"""
+    return datetime.now().isoformat()
+
+def _prepare_templates(templates: Dict[str, str]) -> Dict[str, str]:
+    """Dedent and trim template bodies once at import"""
+    return {level: textwrap.dedent(body).strip() for level, body in templates.items()}
+
+_INVESTIGATION_OVERVIEW_TEMPLATES = _prepare_templates({
+    'basic': """
+        This investigation analyzed {subject} using automated intelligence gathering and risk assessment tools. 
+        The analysis covered identity verification, compliance screening, and basic risk factors. 
+        Overall risk level was determined to be {risk_level}.
+        """,
+    'standard': """
+        This comprehensive investigation of {subject} employed multi-source intelligence analysis 
+        to assess identity, financial, digital, and compliance risk factors. The investigation 
+        utilized advanced AI agents, external data sources, and machine learning models to provide 
+        a thorough risk assessment.
+
+        The analysis encompassed identity verification, digital footprint analysis, financial 
+        intelligence gathering, regulatory compliance screening, and security threat assessment. 
+        All findings were cross-referenced across multiple authoritative data sources to ensure 
+        accuracy and completeness.
+
+        Based on the comprehensive analysis, the overall risk level has been assessed as {risk_level}, 
+        with detailed findings and recommendations provided in the following sections.
+        """,
+    'professional': """
+        This detailed investigation of {subject} represents a comprehensive multi-disciplinary 
+        analysis conducted using advanced artificial intelligence methodologies and extensive 
+        data source integration. The investigation framework employed specialized AI agents 
+        operating across distinct domains of expertise, including cybersecurity, financial 
+        intelligence, regulatory compliance, and behavioral analysis.
+
+        The methodology incorporated real-time data acquisition from nine primary intelligence 
+        sources, machine learning-based risk modeling, and cross-source validation protocols. 
+        Each analytical component was designed to provide independent verification while 
+        contributing to an integrated risk assessment framework.
+
+        Key investigation domains included: (1) Identity verification and background analysis, 
+        (2) Digital infrastructure and online presence evaluation, (3) Financial transaction 
+        patterns and asset verification, (4) Regulatory compliance and sanctions screening, 
+        and (5) Security threat assessment and attribution analysis.
+
+        The investigation concluded with an overall risk classification of {risk_level}, 
+        supported by quantitative risk scoring and qualitative analytical assessments 
+        detailed throughout this report.
+        """,
+    'forensic': """
+        CASE OVERVIEW: This forensic investigation of {subject} was conducted in accordance 
+        with established digital forensics and financial crimes investigation standards. 
+        The investigation employed a systematic methodology designed to meet evidentiary 
+        standards for potential legal proceedings.
+
+        INVESTIGATION SCOPE: The analysis encompassed comprehensive identity authentication, 
+        digital forensics examination, financial transaction analysis, regulatory compliance 
+        verification, and threat attribution assessment. All investigative procedures followed 
+        documented chain-of-custody protocols and utilized verified data sources.
+
+        METHODOLOGY: The investigation utilized a multi-agent artificial intelligence framework 
+        supplemented by external database queries and machine learning risk assessment models. 
+        Each finding was independently verified through multiple sources where possible, with 
+        confidence levels assigned based on source reliability and corroboration.
+
+        PRELIMINARY FINDINGS: Based on the comprehensive analysis, the subject presents a 
+        {risk_level} risk profile. Detailed findings, evidence documentation, and expert 
+        analysis are provided in subsequent sections of this report.
+        """
+})
+
+# Section overviews share one wording for standard and professional reports;
+# any other detail level renders the forensic text
+_SECTION_DETAIL_LEVELS = {'basic': 'basic', 'standard': 'standard', 'professional': 'standard'}
+
+_IDENTITY_OVERVIEW_TEMPLATES = _prepare_templates({
+    'basic': "Identity verification status: {identity_status}. Address history shows {address_count} known addresses.",
+    'standard': """
+        The identity verification analysis examined multiple data points to establish subject 
+        authenticity and background profile. Identity verification returned a status of 
+        "{identity_status}" based on cross-reference with authoritative databases.
+
+        Address history analysis revealed {address_count} documented addresses, providing 
+        insight into residential stability and geographic patterns. Employment and education 
+        verification was conducted where data was available, contributing to the overall 
+        identity confidence assessment.
+        """,
+    'forensic': """
+        IDENTITY AUTHENTICATION: Comprehensive identity verification procedures were conducted 
+        using multiple authoritative databases and cross-reference protocols. The verification 
+        process returned a status of "{identity_status}" with supporting documentation 
+        maintained in the evidence chain.
+
+        BACKGROUND ANALYSIS: Historical address verification identified {address_count} 
+        documented residential addresses. Each address was verified against public records 
+        where available, with geographic and temporal patterns analyzed for consistency 
+        and potential risk indicators.
+        """
+})
+
+_DIGITAL_OVERVIEW_TEMPLATES = _prepare_templates({
+    'basic': "Domain analysis shows {domain_age} with {risk_indicators} risk indicators identified.",
+    'standard': """
+        The digital footprint analysis examined domain registration data, DNS configuration, 
+        SSL certificate status, and email authentication protocols. Domain age analysis 
+        indicates {domain_age}, which factors into the overall digital risk assessment.
+
+        Technical infrastructure analysis identified {risk_indicators} potential risk 
+        indicators requiring further evaluation. Email authentication protocols were 
+        examined for SPF, DKIM, and DMARC compliance to assess communication security posture.
+        """,
+    'forensic': """
+        DIGITAL FORENSICS ANALYSIS: Comprehensive examination of digital infrastructure 
+        including domain registration records, DNS configuration, SSL certificate chain, 
+        and email authentication mechanisms. Domain temporal analysis indicates {domain_age}.
+
+        RISK INDICATOR ASSESSMENT: Technical analysis identified {risk_indicators} digital 
+        risk indicators warranting detailed examination. Each indicator was evaluated for 
+        potential fraud implications and documented with supporting technical evidence.
+        """
+})
+
+_FINANCIAL_OVERVIEW_TEMPLATES = _prepare_templates({
+    'basic': "Credit score: {credit_score}. {suspicious_count} suspicious activities identified.",
+    'standard': """
+        Financial intelligence analysis examined credit history, transaction patterns, 
+        asset verification, and suspicious activity indicators. Credit assessment returned 
+        a score of {credit_score}, which falls within established risk parameters.
+
+        Transaction pattern analysis identified {suspicious_count} activities requiring 
+        additional scrutiny. Asset verification procedures were conducted where data was 
+        available, contributing to the overall financial risk profile assessment.
+        """,
+    'forensic': """
+        FINANCIAL FORENSICS: Comprehensive financial analysis including credit history 
+        verification, transaction pattern analysis, and asset tracing procedures. 
+        Credit assessment documented a score of {credit_score} with supporting verification.
+
+        SUSPICIOUS ACTIVITY ANALYSIS: Financial monitoring identified {suspicious_count} 
+        transactions or patterns requiring detailed examination. Each activity was analyzed 
+        for potential money laundering, fraud, or other financial crime indicators.
+        """
+})
+
+_COMPLIANCE_OVERVIEW_TEMPLATES = _prepare_templates({
+    'basic': "Compliance status: {compliance_status}. Sanctions and PEP screening completed.",
+    'standard': """
+        Regulatory compliance screening was conducted against multiple international 
+        sanctions lists, politically exposed person (PEP) databases, and adverse media 
+        sources. Sanctions screening returned: {sanctions_status}. PEP screening 
+        returned: {pep_status}.
+
+        Overall compliance status was determined to be: {compliance_status}. This assessment 
+        incorporates screening results from OFAC, EU, UK, and UN sanctions lists, as well 
+        as comprehensive PEP and adverse media monitoring.
+        """,
+    'forensic': """
+        REGULATORY COMPLIANCE ANALYSIS: Comprehensive screening conducted against all 
+        relevant international sanctions regimes, PEP databases, and adverse media sources. 
+        Sanctions screening result: {sanctions_status}. PEP screening result: {pep_status}.
+
+        COMPLIANCE DETERMINATION: Based on comprehensive screening protocols, the overall 
+        compliance status has been determined as: {compliance_status}. All screening 
+        results have been documented with timestamps and source attribution for audit purposes.
+        """
+})
+
+_THREAT_OVERVIEW_TEMPLATES = _prepare_templates({
+    'basic': "Threat level: {threat_level}. Security incidents: {security_incidents}.",
+    'standard': """
+        Security threat assessment examined infrastructure vulnerabilities, malware 
+        associations, attack pattern indicators, and historical security incidents. 
+        The analysis determined a threat level of: {threat_level}.
+
+        Security incident analysis returned: {security_incidents}. Infrastructure 
+        analysis included examination of hosting providers, network configurations, 
+        and potential security vulnerabilities that could indicate malicious intent.
+        """,
+    'forensic': """
+        THREAT INTELLIGENCE ANALYSIS: Comprehensive security assessment including 
+        infrastructure vulnerability analysis, malware attribution, attack pattern 
+        recognition, and historical incident correlation. Threat level assessed as: {threat_level}.
+
+        SECURITY INCIDENT CORRELATION: Historical security incident analysis returned: 
+        {security_incidents}. All findings were correlated against known threat actor 
+        profiles and attack methodologies for attribution assessment.
+        """
+})
+
+_GENERIC_OVERVIEW_TEMPLATES = _prepare_templates({
+    'basic': "{section_name} analysis completed with available data sources.",
+    'standard': """
+        The {section_lower} analysis was conducted using multiple data sources 
+        and analytical methodologies. Findings were cross-referenced and validated 
+        where possible to ensure accuracy and completeness of the assessment.
+        """,
+    'forensic': """
+        {section_upper} ANALYSIS: Comprehensive examination conducted using 
+        established investigative protocols and multiple authoritative data sources. 
+        All findings documented with appropriate evidence chain maintenance.
+        """
+})
+
+_RECOMMENDATIONS_HEADER_TEMPLATES = _prepare_templates({
+    'basic': "Based on the investigation findings, the following actions are recommended:",
+    'standard': """
+        Based on the comprehensive investigation and {risk_level} risk assessment, 
+        the following recommendations are provided to address identified risks and 
+        enhance security posture:
+        """,
+    'professional': """
+        STRATEGIC RECOMMENDATIONS
+
+        Based on the detailed multi-source analysis and comprehensive risk assessment 
+        indicating a {risk_level} risk profile, the following strategic recommendations 
+        are provided to address identified vulnerabilities and enhance overall security posture:
+        """,
+    'forensic': """
+        EXPERT RECOMMENDATIONS AND LEGAL CONSIDERATIONS
+
+        Based on the forensic investigation findings and comprehensive risk assessment 
+        indicating a {risk_level} risk classification, the following expert recommendations 
+        are provided with consideration for potential legal and regulatory implications:
+        """
+})
+
+# Per-recommendation blocks for the detailed recommendation templates
+_PROFESSIONAL_RECOMMENDATION_ITEM = (
+    "Recommendation {number}: {recommendation}\n\n"
+    "Priority: {priority}\n"
+    "Implementation Timeline: {timeline}\n\n"
+)
+_FORENSIC_RECOMMENDATION_ITEM = (
+    "Recommendation {number}: {recommendation}\n"
+    "Legal Consideration: Review with legal counsel if implementing\n"
+    "Evidence Support: Documented in investigation findings\n"
+    "Risk Mitigation: {mitigation}\n\n"
+)
+
+_CONCLUSION_TEMPLATES = _prepare_templates({
+    'basic': """
+        This investigation determined a {risk_level} risk level with {confidence:.0%} confidence. 
+        The findings provide sufficient information for risk-based decision making.
+        """,
+    'standard': """
+        INVESTIGATION CONCLUSION
+
+        This comprehensive investigation has determined a {risk_level} risk classification 
+        with {confidence:.0%} confidence based on multi-source analysis and cross-validation. 
+        The investigation successfully gathered and analyzed data from multiple authoritative 
+        sources to provide a thorough risk assessment.
+
+        The findings indicate that appropriate risk management measures should be implemented 
+        based on the identified risk level and specific findings detailed throughout this report.
+        """,
+    'professional': """
+        EXECUTIVE CONCLUSION AND PROFESSIONAL ASSESSMENT
+
+        This detailed investigation has concluded with a {risk_level} risk classification, 
+        supported by comprehensive multi-source analysis and validated through cross-reference 
+        protocols. The assessment confidence level of {confidence:.0%} reflects the quality 
+        and completeness of available data sources.
+
+        The investigation methodology employed advanced artificial intelligence analysis, 
+        external database integration, and machine learning risk modeling to provide a 
+        thorough and objective assessment. All findings have been documented with appropriate 
+        source attribution and confidence levels.
+
+        The risk classification and associated recommendations provide a solid foundation 
+        for informed decision-making and appropriate risk management implementation.
+        """,
+    'forensic': """
+        FORENSIC CONCLUSION AND EXPERT OPINION
+
+        Based on the comprehensive forensic investigation conducted in accordance with 
+        established investigative standards, this analysis concludes with a {risk_level} 
+        risk classification. The assessment confidence level of {confidence:.0%} is 
+        supported by documented evidence and verified data sources.
+
+        EXPERT OPINION: The investigation methodology employed recognized forensic 
+        techniques and maintained appropriate evidence chain documentation. All findings 
+        are based on verifiable data sources and have been documented with sufficient 
+        detail to support potential legal or regulatory proceedings.
+
+        The risk assessment and associated findings provide a professional foundation 
+        for risk-based decision making and potential legal considerations. All evidence 
+        and documentation have been preserved in accordance with forensic standards.
+        """
+})
+
+@dataclass(slots=True)
 class ContentSection:
     """Generated content section"""
     section_id: str
@@ -30,201 +426,81 @@ class AIContentWriter:
     """AI-powered content writer for investigation reports"""
     
     def __init__(self):
-        self.writing_styles = {
-            'basic': 'clear and concise',
-            'standard': 'comprehensive and professional',
-            'professional': 'detailed and analytical',
-            'forensic': 'precise and legally-oriented'
+        self._section_writers = {
+            'identity_verification': self._write_identity_overview,
+            'digital_footprint': self._write_digital_overview,
+            'financial_intelligence': self._write_financial_overview,
+            'compliance_screening': self._write_compliance_overview,
+            'threat_assessment': self._write_threat_overview
         }
     
     def write_investigation_overview(self, data: Dict[str, Any], detail_level: str = 'standard') -> str:
         """Generate investigation overview content"""
         subject = data.get('subject', 'the subject')
-        investigation_type = data.get('investigation_type', 'comprehensive')
         risk_level = self._extract_risk_level(data)
         
-        style = self.writing_styles.get(detail_level, 'professional')
-        
-        if detail_level == 'basic':
-            return f"""
-            This investigation analyzed {subject} using automated intelligence gathering and risk assessment tools. 
-            The analysis covered identity verification, compliance screening, and basic risk factors. 
-            Overall risk level was determined to be {risk_level}.
-            """
-        
-        elif detail_level == 'standard':
-            return f"""
-            This comprehensive investigation of {subject} employed multi-source intelligence analysis 
-            to assess identity, financial, digital, and compliance risk factors. The investigation 
-            utilized advanced AI agents, external data sources, and machine learning models to provide 
-            a thorough risk assessment.
-            
-            The analysis encompassed identity verification, digital footprint analysis, financial 
-            intelligence gathering, regulatory compliance screening, and security threat assessment. 
-            All findings were cross-referenced across multiple authoritative data sources to ensure 
-            accuracy and completeness.
-            
-            Based on the comprehensive analysis, the overall risk level has been assessed as {risk_level}, 
-            with detailed findings and recommendations provided in the following sections.
-            """
-        
-        elif detail_level == 'professional':
-            return f"""
-            This detailed investigation of {subject} represents a comprehensive multi-disciplinary 
-            analysis conducted using advanced artificial intelligence methodologies and extensive 
-            data source integration. The investigation framework employed specialized AI agents 
-            operating across distinct domains of expertise, including cybersecurity, financial 
-            intelligence, regulatory compliance, and behavioral analysis.
-            
-            The methodology incorporated real-time data acquisition from nine primary intelligence 
-            sources, machine learning-based risk modeling, and cross-source validation protocols. 
-            Each analytical component was designed to provide independent verification while 
-            contributing to an integrated risk assessment framework.
-            
-            Key investigation domains included: (1) Identity verification and background analysis, 
-            (2) Digital infrastructure and online presence evaluation, (3) Financial transaction 
-            patterns and asset verification, (4) Regulatory compliance and sanctions screening, 
-            and (5) Security threat assessment and attribution analysis.
-            
-            The investigation concluded with an overall risk classification of {risk_level}, 
-            supported by quantitative risk scoring and qualitative analytical assessments 
-            detailed throughout this report.
-            """
-        
-        else:  # forensic
-            return f"""
-            CASE OVERVIEW: This forensic investigation of {subject} was conducted in accordance 
-            with established digital forensics and financial crimes investigation standards. 
-            The investigation employed a systematic methodology designed to meet evidentiary 
-            standards for potential legal proceedings.
-            
-            INVESTIGATION SCOPE: The analysis encompassed comprehensive identity authentication, 
-            digital forensics examination, financial transaction analysis, regulatory compliance 
-            verification, and threat attribution assessment. All investigative procedures followed 
-            documented chain-of-custody protocols and utilized verified data sources.
-            
-            METHODOLOGY: The investigation utilized a multi-agent artificial intelligence framework 
-            supplemented by external database queries and machine learning risk assessment models. 
-            Each finding was independently verified through multiple sources where possible, with 
-            confidence levels assigned based on source reliability and corroboration.
-            
-            PRELIMINARY FINDINGS: Based on the comprehensive analysis, the subject presents a 
-            {risk_level} risk profile. Detailed findings, evidence documentation, and expert 
-            analysis are provided in subsequent sections of this report.
-            """
+        return self._render_investigation_overview(str(subject), risk_level, detail_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_investigation_overview(subject: str, risk_level: str, detail_level: str) -> str:
+        """Render the investigation overview; memoized on its inputs"""
+        templates = _INVESTIGATION_OVERVIEW_TEMPLATES
+        template = templates.get(detail_level, templates['forensic'])
+        return template.format(subject=subject, risk_level=risk_level)
     
     def write_section_overview(self, section_data: Dict[str, Any], section_type: str, 
                              detail_level: str = 'standard') -> str:
         """Generate section overview content"""
+        writer = self._section_writers.get(section_type)
         
-        if section_type == 'identity_verification':
-            return self._write_identity_overview(section_data, detail_level)
-        elif section_type == 'digital_footprint':
-            return self._write_digital_overview(section_data, detail_level)
-        elif section_type == 'financial_intelligence':
-            return self._write_financial_overview(section_data, detail_level)
-        elif section_type == 'compliance_screening':
-            return self._write_compliance_overview(section_data, detail_level)
-        elif section_type == 'threat_assessment':
-            return self._write_threat_overview(section_data, detail_level)
-        else:
+        if writer is None:
             return self._write_generic_overview(section_data, section_type, detail_level)
+        
+        return writer(section_data, detail_level)
     
     def _write_identity_overview(self, data: Dict[str, Any], detail_level: str) -> str:
         """Write identity verification section overview"""
         identity_status = data.get('identity_status', 'Unknown')
-        address_count = len(data.get('address_history', []))
-        
-        if detail_level == 'basic':
-            return f"Identity verification status: {identity_status}. Address history shows {address_count} known addresses."
+        address_count = len(data.get('address_history', ()))
         
-        elif detail_level in ['standard', 'professional']:
-            return f"""
-            The identity verification analysis examined multiple data points to establish subject 
-            authenticity and background profile. Identity verification returned a status of 
-            "{identity_status}" based on cross-reference with authoritative databases.
-            
-            Address history analysis revealed {address_count} documented addresses, providing 
-            insight into residential stability and geographic patterns. Employment and education 
-            verification was conducted where data was available, contributing to the overall 
-            identity confidence assessment.
-            """
-        
-        else:  # forensic
-            return f"""
-            IDENTITY AUTHENTICATION: Comprehensive identity verification procedures were conducted 
-            using multiple authoritative databases and cross-reference protocols. The verification 
-            process returned a status of "{identity_status}" with supporting documentation 
-            maintained in the evidence chain.
-            
-            BACKGROUND ANALYSIS: Historical address verification identified {address_count} 
-            documented residential addresses. Each address was verified against public records 
-            where available, with geographic and temporal patterns analyzed for consistency 
-            and potential risk indicators.
-            """
+        return self._render_identity_overview(str(identity_status), address_count, detail_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_identity_overview(identity_status: str, address_count: int, detail_level: str) -> str:
+        """Render the identity verification overview; memoized on its inputs"""
+        template = _IDENTITY_OVERVIEW_TEMPLATES[_SECTION_DETAIL_LEVELS.get(detail_level, 'forensic')]
+        return template.format(identity_status=identity_status, address_count=address_count)
     
     def _write_digital_overview(self, data: Dict[str, Any], detail_level: str) -> str:
         """Write digital footprint section overview"""
         domain_data = data.get('domain_analysis', {})
-        email_data = data.get('email_analysis', {})
-        
         domain_age = domain_data.get('domain_age', 'Unknown')
-        risk_indicators = len(domain_data.get('risk_indicators', []))
+        risk_indicators = len(domain_data.get('risk_indicators', ()))
         
-        if detail_level == 'basic':
-            return f"Domain analysis shows {domain_age} with {risk_indicators} risk indicators identified."
-        
-        elif detail_level in ['standard', 'professional']:
-            return f"""
-            The digital footprint analysis examined domain registration data, DNS configuration, 
-            SSL certificate status, and email authentication protocols. Domain age analysis 
-            indicates {domain_age}, which factors into the overall digital risk assessment.
-            
-            Technical infrastructure analysis identified {risk_indicators} potential risk 
-            indicators requiring further evaluation. Email authentication protocols were 
-            examined for SPF, DKIM, and DMARC compliance to assess communication security posture.
-            """
-        
-        else:  # forensic
-            return f"""
-            DIGITAL FORENSICS ANALYSIS: Comprehensive examination of digital infrastructure 
-            including domain registration records, DNS configuration, SSL certificate chain, 
-            and email authentication mechanisms. Domain temporal analysis indicates {domain_age}.
-            
-            RISK INDICATOR ASSESSMENT: Technical analysis identified {risk_indicators} digital 
-            risk indicators warranting detailed examination. Each indicator was evaluated for 
-            potential fraud implications and documented with supporting technical evidence.
-            """
+        return self._render_digital_overview(str(domain_age), risk_indicators, detail_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_digital_overview(domain_age: str, risk_indicators: int, detail_level: str) -> str:
+        """Render the digital footprint overview; memoized on its inputs"""
+        template = _DIGITAL_OVERVIEW_TEMPLATES[_SECTION_DETAIL_LEVELS.get(detail_level, 'forensic')]
+        return template.format(domain_age=domain_age, risk_indicators=risk_indicators)
     
     def _write_financial_overview(self, data: Dict[str, Any], detail_level: str) -> str:
         """Write financial intelligence section overview"""
         credit_score = data.get('credit_score', 0)
-        suspicious_count = len(data.get('suspicious_activities', []))
+        suspicious_count = len(data.get('suspicious_activities', ()))
         
-        if detail_level == 'basic':
-            return f"Credit score: {credit_score}. {suspicious_count} suspicious activities identified."
-        
-        elif detail_level in ['standard', 'professional']:
-            return f"""
-            Financial intelligence analysis examined credit history, transaction patterns, 
-            asset verification, and suspicious activity indicators. Credit assessment returned 
-            a score of {credit_score}, which falls within established risk parameters.
-            
-            Transaction pattern analysis identified {suspicious_count} activities requiring 
-            additional scrutiny. Asset verification procedures were conducted where data was 
-            available, contributing to the overall financial risk profile assessment.
-            """
-        
-        else:  # forensic
-            return f"""
-            FINANCIAL FORENSICS: Comprehensive financial analysis including credit history 
-            verification, transaction pattern analysis, and asset tracing procedures. 
-            Credit assessment documented a score of {credit_score} with supporting verification.
-            
-            SUSPICIOUS ACTIVITY ANALYSIS: Financial monitoring identified {suspicious_count} 
-            transactions or patterns requiring detailed examination. Each activity was analyzed 
-            for potential money laundering, fraud, or other financial crime indicators.
-            """
+        return self._render_financial_overview(str(credit_score), suspicious_count, detail_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_financial_overview(credit_score: str, suspicious_count: int, detail_level: str) -> str:
+        """Render the financial intelligence overview; memoized on its inputs"""
+        template = _FINANCIAL_OVERVIEW_TEMPLATES[_SECTION_DETAIL_LEVELS.get(detail_level, 'forensic')]
+        return template.format(credit_score=credit_score, suspicious_count=suspicious_count)
     
     def _write_compliance_overview(self, data: Dict[str, Any], detail_level: str) -> str:
         """Write compliance screening section overview"""
@@ -232,82 +508,44 @@ class AIContentWriter:
         pep_status = data.get('pep_screening', 'Not screened')
         compliance_status = data.get('compliance_status', 'Unknown')
         
-        if detail_level == 'basic':
-            return f"Compliance status: {compliance_status}. Sanctions and PEP screening completed."
-        
-        elif detail_level in ['standard', 'professional']:
-            return f"""
-            Regulatory compliance screening was conducted against multiple international 
-            sanctions lists, politically exposed person (PEP) databases, and adverse media 
-            sources. Sanctions screening returned: {sanctions_status}. PEP screening 
-            returned: {pep_status}.
-            
-            Overall compliance status was determined to be: {compliance_status}. This assessment 
-            incorporates screening results from OFAC, EU, UK, and UN sanctions lists, as well 
-            as comprehensive PEP and adverse media monitoring.
-            """
-        
-        else:  # forensic
-            return f"""
-            REGULATORY COMPLIANCE ANALYSIS: Comprehensive screening conducted against all 
-            relevant international sanctions regimes, PEP databases, and adverse media sources. 
-            Sanctions screening result: {sanctions_status}. PEP screening result: {pep_status}.
-            
-            COMPLIANCE DETERMINATION: Based on comprehensive screening protocols, the overall 
-            compliance status has been determined as: {compliance_status}. All screening 
-            results have been documented with timestamps and source attribution for audit purposes.
-            """
+        return self._render_compliance_overview(str(sanctions_status), str(pep_status),
+                                                str(compliance_status), detail_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_compliance_overview(sanctions_status: str, pep_status: str, compliance_status: str,
+                                    detail_level: str) -> str:
+        """Render the compliance screening overview; memoized on its inputs"""
+        template = _COMPLIANCE_OVERVIEW_TEMPLATES[_SECTION_DETAIL_LEVELS.get(detail_level, 'forensic')]
+        return template.format(sanctions_status=sanctions_status, pep_status=pep_status,
+                               compliance_status=compliance_status)
     
     def _write_threat_overview(self, data: Dict[str, Any], detail_level: str) -> str:
         """Write threat assessment section overview"""
         threat_level = data.get('threat_level', 'Unknown')
         security_incidents = data.get('security_incidents', 'Not checked')
         
-        if detail_level == 'basic':
-            return f"Threat level: {threat_level}. Security incidents: {security_incidents}."
-        
-        elif detail_level in ['standard', 'professional']:
-            return f"""
-            Security threat assessment examined infrastructure vulnerabilities, malware 
-            associations, attack pattern indicators, and historical security incidents. 
-            The analysis determined a threat level of: {threat_level}.
-            
-            Security incident analysis returned: {security_incidents}. Infrastructure 
-            analysis included examination of hosting providers, network configurations, 
-            and potential security vulnerabilities that could indicate malicious intent.
-            """
-        
-        else:  # forensic
-            return f"""
-            THREAT INTELLIGENCE ANALYSIS: Comprehensive security assessment including 
-            infrastructure vulnerability analysis, malware attribution, attack pattern 
-            recognition, and historical incident correlation. Threat level assessed as: {threat_level}.
-            
-            SECURITY INCIDENT CORRELATION: Historical security incident analysis returned: 
-            {security_incidents}. All findings were correlated against known threat actor 
-            profiles and attack methodologies for attribution assessment.
-            """
+        return self._render_threat_overview(str(threat_level), str(security_incidents), detail_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_threat_overview(threat_level: str, security_incidents: str, detail_level: str) -> str:
+        """Render the threat assessment overview; memoized on its inputs"""
+        template = _THREAT_OVERVIEW_TEMPLATES[_SECTION_DETAIL_LEVELS.get(detail_level, 'forensic')]
+        return template.format(threat_level=threat_level, security_incidents=security_incidents)
     
     def _write_generic_overview(self, data: Dict[str, Any], section_type: str, detail_level: str) -> str:
         """Write generic section overview"""
-        section_name = section_type.replace('_', ' ').title()
-        
-        if detail_level == 'basic':
-            return f"{section_name} analysis completed with available data sources."
-        
-        elif detail_level in ['standard', 'professional']:
-            return f"""
-            The {section_name.lower()} analysis was conducted using multiple data sources 
-            and analytical methodologies. Findings were cross-referenced and validated 
-            where possible to ensure accuracy and completeness of the assessment.
-            """
-        
-        else:  # forensic
-            return f"""
-            {section_name.upper()} ANALYSIS: Comprehensive examination conducted using 
-            established investigative protocols and multiple authoritative data sources. 
-            All findings documented with appropriate evidence chain maintenance.
-            """
+        return self._render_generic_overview(section_type, detail_level)
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _render_generic_overview(section_type: str, detail_level: str) -> str:
+        """Render the generic section overview; memoized on its inputs"""
+        section_name = _pretty_key(section_type)
+        template = _GENERIC_OVERVIEW_TEMPLATES[_SECTION_DETAIL_LEVELS.get(detail_level, 'forensic')]
+        return template.format(section_name=section_name, section_lower=section_name.lower(),
+                               section_upper=section_name.upper())
     
     def analyze_findings(self, section_data: Dict[str, Any], section_type: str, 
                         detail_level: str = 'standard') -> str:
@@ -335,13 +573,18 @@ class AIContentWriter:
         
         for key, value in data.items():
             if isinstance(value, str) and value and value != 'Unknown':
-                findings.append(f"{key.replace('_', ' ').title()}: {value}")
+                findings.append(f"{_pretty_key(key)}: {value}")
             elif isinstance(value, (int, float)) and value > 0:
-                findings.append(f"{key.replace('_', ' ').title()}: {value}")
+                findings.append(f"{_pretty_key(key)}: {value}")
             elif isinstance(value, list) and value:
-                findings.append(f"{key.replace('_', ' ').title()}: {len(value)} items identified")
+                findings.append(f"{_pretty_key(key)}: {len(value)} items identified")
+            else:
+                continue
+            
+            if len(findings) == 5:  # Top 5 findings
+                break
         
-        return findings[:5]  # Top 5 findings
+        return findings
     
     def _extract_risk_indicators(self, data: Dict[str, Any]) -> List[str]:
         """Extract risk indicators from section data"""
@@ -356,122 +599,100 @@ class AIContentWriter:
             risk_indicators.extend(data['suspicious_activities'])
         
         # Look for negative findings
-        negative_keywords = ['suspicious', 'risk', 'threat', 'violation', 'fraud', 'illegal']
-        
         for key, value in data.items():
-            if isinstance(value, str):
-                for keyword in negative_keywords:
-                    if keyword.lower() in value.lower():
-                        risk_indicators.append(f"{key.replace('_', ' ').title()}: {value}")
-                        break
+            if isinstance(value, str) and _NEGATIVE_KEYWORD_RE.search(value):
+                risk_indicators.append(f"{_pretty_key(key)}: {value}")
         
-        return list(set(risk_indicators))  # Remove duplicates
+        return list(dict.fromkeys(risk_indicators))  # Remove duplicates
     
     def _generate_basic_analysis(self, findings: List[str], risk_indicators: List[str]) -> str:
         """Generate basic analysis content"""
-        analysis = "Key findings:\n"
-        
-        for finding in findings[:3]:
-            analysis += f"• {finding}\n"
+        parts = ["Key findings:\n"]
+        parts.extend(f"{_BULLET}{finding}\n" for finding in findings[:3])
         
         if risk_indicators:
-            analysis += f"\nRisk indicators identified: {len(risk_indicators)}"
+            parts.append(f"\nRisk indicators identified: {len(risk_indicators)}")
         else:
-            analysis += "\nNo significant risk indicators identified."
+            parts.append("\nNo significant risk indicators identified.")
         
-        return analysis
+        return "".join(parts)
     
     def _generate_standard_analysis(self, findings: List[str], risk_indicators: List[str], 
                                   section_type: str) -> str:
         """Generate standard analysis content"""
-        analysis = f"Analysis of {section_type.replace('_', ' ')} data reveals the following key findings:\n\n"
-        
-        for i, finding in enumerate(findings, 1):
-            analysis += f"{i}. {finding}\n"
+        parts = [f"Analysis of {section_type.replace('_', ' ')} data reveals the following key findings:\n\n"]
+        parts.extend(f"{i}. {finding}\n" for i, finding in enumerate(findings, 1))
         
         if risk_indicators:
-            analysis += f"\nRisk Assessment:\n"
-            analysis += f"The analysis identified {len(risk_indicators)} risk indicators requiring attention:\n"
-            
-            for indicator in risk_indicators[:3]:
-                analysis += f"• {indicator}\n"
+            parts.append("\nRisk Assessment:\n")
+            parts.append(f"The analysis identified {len(risk_indicators)} risk indicators requiring attention:\n")
+            parts.extend(f"{_BULLET}{indicator}\n" for indicator in risk_indicators[:3])
             
             if len(risk_indicators) > 3:
-                analysis += f"• Additional {len(risk_indicators) - 3} indicators documented\n"
+                parts.append(f"{_BULLET}Additional {len(risk_indicators) - 3} indicators documented\n")
         else:
-            analysis += "\nRisk Assessment:\nNo significant risk indicators were identified in this category."
+            parts.append("\nRisk Assessment:\nNo significant risk indicators were identified in this category.")
         
-        return analysis
+        return "".join(parts)
     
     def _generate_professional_analysis(self, findings: List[str], risk_indicators: List[str], 
                                       section_type: str) -> str:
         """Generate professional analysis content"""
-        section_name = section_type.replace('_', ' ').title()
-        
-        analysis = f"ANALYTICAL ASSESSMENT - {section_name.upper()}\n\n"
-        analysis += f"The comprehensive analysis of {section_name.lower()} data employed multiple "
-        analysis += f"verification methodologies and cross-source validation protocols. "
-        analysis += f"The following findings represent the most significant discoveries:\n\n"
+        section_name = _pretty_key(section_type)
+        section_lower = section_name.lower()
         
-        for i, finding in enumerate(findings, 1):
-            analysis += f"{i}. {finding}\n"
+        parts = [
+            f"{_PROFESSIONAL_HEADER}{section_name.upper()}\n\n",
+            f"The comprehensive analysis of {section_lower}",
+            _PROFESSIONAL_METHODOLOGY
+        ]
+        parts.extend(f"{i}. {finding}\n" for i, finding in enumerate(findings, 1))
         
-        analysis += f"\nRISK FACTOR ANALYSIS:\n"
+        parts.append("\nRISK FACTOR ANALYSIS:\n")
         
         if risk_indicators:
-            analysis += f"The investigation identified {len(risk_indicators)} risk factors "
-            analysis += f"requiring detailed evaluation and potential mitigation measures:\n\n"
-            
-            for i, indicator in enumerate(risk_indicators, 1):
-                analysis += f"Risk Factor {i}: {indicator}\n"
-            
-            analysis += f"\nThe presence of these risk factors suggests enhanced monitoring "
-            analysis += f"and additional verification procedures may be warranted."
+            parts.append(f"The investigation identified {len(risk_indicators)}")
+            parts.append(_PROFESSIONAL_RISK_INTRO)
+            parts.extend(f"Risk Factor {i}: {indicator}\n" for i, indicator in enumerate(risk_indicators, 1))
+            parts.append(_PROFESSIONAL_RISK_CLOSING)
         else:
-            analysis += f"The analysis did not identify significant risk factors in the "
-            analysis += f"{section_name.lower()} category. This finding supports a lower "
-            analysis += f"risk classification for this analytical domain."
+            parts.append(f"The analysis did not identify significant risk factors in the {section_lower}")
+            parts.append(_PROFESSIONAL_NO_RISK_CLOSING)
         
-        return analysis
+        return "".join(parts)
     
     def _generate_forensic_analysis(self, findings: List[str], risk_indicators: List[str], 
                                   section_type: str) -> str:
         """Generate forensic analysis content"""
-        section_name = section_type.replace('_', ' ').title()
-        
-        analysis = f"FORENSIC ANALYSIS - {section_name.upper()}\n\n"
-        analysis += f"METHODOLOGY: The forensic examination of {section_name.lower()} data "
-        analysis += f"was conducted using established investigative protocols with appropriate "
-        analysis += f"documentation of evidence chain and source verification.\n\n"
+        section_name = _pretty_key(section_type)
         
-        analysis += f"FINDINGS:\n"
+        parts = [
+            f"{_FORENSIC_HEADER}{section_name.upper()}\n\n",
+            f"METHODOLOGY: The forensic examination of {section_name.lower()}",
+            _FORENSIC_METHODOLOGY
+        ]
         
         for i, finding in enumerate(findings, 1):
-            analysis += f"Finding {i}: {finding}\n"
-            analysis += f"  Source: Verified through authoritative database\n"
-            analysis += f"  Confidence: High\n\n"
+            parts.append(f"Finding {i}: {finding}")
+            parts.append(_FORENSIC_FINDING_NOTES)
         
-        analysis += f"RISK INDICATOR ASSESSMENT:\n"
+        parts.append("RISK INDICATOR ASSESSMENT:\n")
         
         if risk_indicators:
-            analysis += f"The forensic analysis identified {len(risk_indicators)} risk indicators "
-            analysis += f"that warrant detailed examination and potential investigative follow-up:\n\n"
+            parts.append(f"The forensic analysis identified {len(risk_indicators)}")
+            parts.append(_FORENSIC_RISK_INTRO)
             
             for i, indicator in enumerate(risk_indicators, 1):
-                analysis += f"Risk Indicator {i}: {indicator}\n"
-                analysis += f"  Classification: Requires investigation\n"
-                analysis += f"  Evidence Status: Documented\n\n"
+                parts.append(f"Risk Indicator {i}: {indicator}")
+                parts.append(_FORENSIC_INDICATOR_NOTES)
             
-            analysis += f"EXPERT OPINION: The presence of documented risk indicators suggests "
-            analysis += f"that additional investigative measures and enhanced due diligence "
-            analysis += f"procedures are recommended."
+            parts.append(_FORENSIC_RISK_OPINION)
         else:
-            analysis += f"The forensic examination did not identify material risk indicators "
-            analysis += f"in the {section_name.lower()} category.\n\n"
-            analysis += f"EXPERT OPINION: The absence of significant risk indicators supports "
-            analysis += f"a favorable assessment in this investigative domain."
+            parts.append("The forensic examination did not identify material risk indicators ")
+            parts.append(f"in the {section_name.lower()}")
+            parts.append(_FORENSIC_NO_RISK_OPINION)
         
-        return analysis
+        return "".join(parts)
     
     def _extract_risk_level(self, data: Dict[str, Any]) -> str:
         """Extract risk level from data"""
@@ -487,20 +708,24 @@ class AIContentWriter:
 class ContentFormatter:
     """Formats generated content for different output types"""
     
-    def __init__(self):
-        self.formatting_rules = {
-            'basic': {'max_paragraph_length': 500, 'bullet_points': True},
-            'standard': {'max_paragraph_length': 800, 'bullet_points': True},
-            'professional': {'max_paragraph_length': 1200, 'bullet_points': False},
-            'forensic': {'max_paragraph_length': 1000, 'bullet_points': False}
-        }
+    FORMATTING_RULES = MappingProxyType({
+        'basic': MappingProxyType({'max_paragraph_length': 500, 'bullet_points': True}),
+        'standard': MappingProxyType({'max_paragraph_length': 800, 'bullet_points': True}),
+        'professional': MappingProxyType({'max_paragraph_length': 1200, 'bullet_points': False}),
+        'forensic': MappingProxyType({'max_paragraph_length': 1000, 'bullet_points': False})
+    })
     
-    def format_executive_summary(self, summary: Dict[str, Any], template_type: str) -> Dict[str, Any]:
+    def format_executive_summary(self, summary: Dict[str, Any], template_type: str,
+                                 overview: Optional[str] = None) -> Dict[str, Any]:
         """Format executive summary content"""
-        rules = self.formatting_rules.get(template_type, self.formatting_rules['standard'])
+        rules = self.FORMATTING_RULES.get(template_type, self.FORMATTING_RULES['standard'])
+        
+        # A generated overview can be passed separately from the summary fields
+        if overview is None:
+            overview = summary.get('overview', '')
         
         formatted_summary = {
-            'overview': self._format_text(summary.get('overview', ''), rules),
+            'overview': self._format_text(overview, rules),
             'risk_assessment': summary.get('risk_assessment', {}),
             'key_findings': self._format_findings_list(summary.get('key_findings', []), template_type),
             'data_sources': summary.get('data_sources', 0),
@@ -511,56 +736,58 @@ class ContentFormatter:
     
     def format_section(self, content: Dict[str, Any], template_type: str) -> Dict[str, Any]:
         """Format section content"""
-        rules = self.formatting_rules.get(template_type, self.formatting_rules['standard'])
+        rules = self.FORMATTING_RULES.get(template_type, self.FORMATTING_RULES['standard'])
         
-        formatted_content = content.copy()
+        changes = {}
         
-        # Format text content
-        if 'overview' in content:
-            formatted_content['overview'] = self._format_text(content['overview'], rules)
-        
-        if 'analysis' in content:
-            formatted_content['analysis'] = self._format_text(content['analysis'], rules)
+        # Format text content, keeping only fields the formatter actually changed
+        for field in ('overview', 'analysis'):
+            if field in content:
+                text = self._format_text(content[field], rules)
+                if text is not content[field]:
+                    changes[field] = text
         
         # Format findings
         if 'findings' in content:
-            formatted_content['findings'] = self._format_findings_list(content['findings'], template_type)
+            changes['findings'] = self._format_findings_list(content['findings'], template_type)
+        
+        if not changes:
+            return content
         
-        return formatted_content
+        return {**content, **changes}
     
     def _format_text(self, text: str, rules: Dict[str, Any]) -> str:
         """Format text according to rules"""
         if not text:
             return text
         
+        max_length = rules.get('max_paragraph_length', 800)
+        
+        # Short single-line text that is already whitespace-normalized needs no work.
+        # isprintable() is False for every whitespace character other than ' ', so
+        # together with the run and edge checks nothing here would change under _WS_RE
+        if (len(text) <= max_length and text.isprintable() and '  ' not in text
+                and text[0] != ' ' and text[-1] != ' '):
+            return text
+        
         # Clean up whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
+        text = _WS_RE.sub(' ', text.strip())
         
         # Break into paragraphs if too long
-        max_length = rules.get('max_paragraph_length', 800)
-        
         if len(text) <= max_length:
             return text
         
         # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = _SENTENCE_RE.split(text)
+        offsets = list(accumulate(map(len, sentences), initial=0))
         paragraphs = []
-        current_paragraph = []
-        current_length = 0
+        start = 0
         
-        for sentence in sentences:
-            sentence_length = len(sentence)
-            
-            if current_length + sentence_length > max_length and current_paragraph:
-                paragraphs.append(' '.join(current_paragraph))
-                current_paragraph = [sentence]
-                current_length = sentence_length
-            else:
-                current_paragraph.append(sentence)
-                current_length += sentence_length
-        
-        if current_paragraph:
-            paragraphs.append(' '.join(current_paragraph))
+        # Each paragraph runs up to the first sentence that would push it past max_length
+        while start < len(sentences):
+            end = max(bisect_right(offsets, offsets[start] + max_length) - 1, start + 1)
+            paragraphs.append(' '.join(sentences[start:end]))
+            start = end
         
         return '\n\n'.join(paragraphs)
     
@@ -569,28 +796,32 @@ class ContentFormatter:
         if not findings:
             return findings
         
-        rules = self.formatting_rules.get(template_type, self.formatting_rules['standard'])
-        
-        formatted_findings = []
+        rules = self.FORMATTING_RULES.get(template_type, self.FORMATTING_RULES['standard'])
         
-        for finding in findings:
-            # Clean up the finding text
-            formatted_finding = finding.strip()
-            
-            # Add bullet point if required
-            if rules.get('bullet_points', True) and not formatted_finding.startswith('•'):
-                formatted_finding = f"• {formatted_finding}"
-            
-            formatted_findings.append(formatted_finding)
+        if not rules.get('bullet_points', True):
+            return [finding.strip() for finding in findings]
         
-        return formatted_findings
+        # Add a bullet point to each cleaned finding that does not already have one
+        return [
+            finding if finding.startswith(_BULLET_GLYPH) else _BULLET + finding
+            for finding in (item.strip() for item in findings)
+        ]
 
 class ReportContentGenerator:
     """Main content generator for investigation reports"""
     
-    def __init__(self):
+    def __init__(self, max_workers: int = 1):
         self.ai_writer = AIContentWriter()
         self.formatter = ContentFormatter()
+        # Sections are generated serially unless more than one worker is allowed
+        self.max_workers = max_workers
+        
+        self._recommendation_writers = {
+            'basic': self._write_basic_recommendations,
+            'standard': self._write_standard_recommendations,
+            'professional': self._write_professional_recommendations,
+            'forensic': self._write_forensic_recommendations
+        }
         
         logger.info("Initialized ReportContentGenerator")
     
@@ -599,6 +830,9 @@ class ReportContentGenerator:
         logger.info(f"Generating {template_type} report content")
         
         try:
+            # Shared by the recommendations and the conclusion
+            risk_level = self._extract_risk_level(data)
+            
             # Generate executive summary
             executive_summary = self.generate_executive_summary(data, template_type)
             
@@ -606,10 +840,10 @@ class ReportContentGenerator:
             sections = self.generate_all_sections(data, template_type)
             
             # Generate recommendations
-            recommendations = self.generate_recommendations_content(data, template_type)
+            recommendations = self.generate_recommendations_content(data, template_type, risk_level)
             
             # Generate conclusion
-            conclusion = self.generate_conclusion(data, template_type)
+            conclusion = self.generate_conclusion(data, template_type, risk_level)
             
             complete_content = {
                 'executive_summary': executive_summary,
@@ -617,7 +851,7 @@ class ReportContentGenerator:
                 'recommendations': recommendations,
                 'conclusion': conclusion,
                 'generation_metadata': {
-                    'generated_at': datetime.now().isoformat(),
+                    'generated_at': self._fresh_timestamp(),
                     'template_type': template_type,
                     'content_generator_version': '1.0.0',
                     'total_sections': len(sections)
@@ -631,6 +865,11 @@ class ReportContentGenerator:
             logger.error(f"Error generating report content: {str(e)}")
             raise
     
+    @staticmethod
+    def _fresh_timestamp(granularity_s: float = 1.0) -> str:
+        """Return the generation timestamp, reused for reports within the same granularity window"""
+        return _timestamp_for_tick(int(time.monotonic() // granularity_s))
+    
     def generate_executive_summary(self, data: Dict[str, Any], template_type: str) -> Dict[str, Any]:
         """Generate executive summary content"""
         executive_data = data.get('executive_summary', {})
@@ -638,170 +877,155 @@ class ReportContentGenerator:
         # Generate overview
         overview = self.ai_writer.write_investigation_overview(data, template_type)
         
-        # Format the summary
-        summary_content = {
-            'overview': overview,
-            'risk_assessment': executive_data.get('risk_assessment', {}),
-            'key_findings': executive_data.get('key_findings', []),
-            'data_sources': executive_data.get('data_sources_used', 0),
-            'summary_statement': executive_data.get('summary_statement', '')
-        }
-        
-        return self.formatter.format_executive_summary(summary_content, template_type)
+        # Format the summary from the executive data, under the formatter's data_sources name
+        summary_content = dict(executive_data, data_sources=executive_data.get('data_sources_used', 0))
+        return self.formatter.format_executive_summary(summary_content, template_type, overview=overview)
     
     def generate_all_sections(self, data: Dict[str, Any], template_type: str) -> List[Dict[str, Any]]:
         """Generate content for all report sections"""
-        sections = []
         detailed_findings = data.get('detailed_findings', {})
         
-        for section_id, section_data in detailed_findings.items():
-            section_content = self.generate_section_content(section_id, section_data, template_type)
-            sections.append(section_content)
-        
-        return sections
+        if self.max_workers > 1 and len(detailed_findings) > 1:
+            workers = min(self.max_workers, len(detailed_findings))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(self.generate_section_content, section_id, section_data, template_type)
+                    for section_id, section_data in detailed_findings.items()
+                ]
+                # Results are collected in submission order to keep the report's section order
+                return [future.result() for future in futures]
+        
+        generate = self.generate_section_content
+        return [
+            generate(section_id, section_data, template_type)
+            for section_id, section_data in detailed_findings.items()
+        ]
     
     def generate_section_content(self, section_id: str, section_data: Dict[str, Any], 
                                template_type: str) -> Dict[str, Any]:
         """Generate content for a specific section"""
+        if self._is_empty_section(section_data):
+            return self._empty_section_content(section_id, section_data, template_type)
         
-        # Generate section overview
-        overview = self.ai_writer.write_section_overview(section_data, section_id, template_type)
-        
-        # Generate detailed analysis
-        analysis = self.ai_writer.analyze_findings(section_data, section_id, template_type)
-        
-        # Extract key findings
-        findings = self._extract_section_findings(section_data)
+        overview, analysis, findings = self._generate_section_text(section_data, section_id, template_type)
         
+        return self._format_section_content(section_id, section_data, template_type,
+                                            overview, analysis, list(findings))
+    
+    def _format_section_content(self, section_id: str, section_data: Dict[str, Any], template_type: str,
+                                overview: str, analysis: str, findings: List[str]) -> Dict[str, Any]:
+        """Assemble and format a generated section"""
         section_content = {
             'section_id': section_id,
-            'title': section_id.replace('_', ' ').title(),
+            'title': _pretty_key(section_id),
             'overview': overview,
             'analysis': analysis,
-            'findings': findings,
-            'data': section_data
+            'findings': findings
         }
         
+        # Basic reports never show raw field values, so they skip the data copy
+        if template_type != 'basic':
+            section_content['data'] = self._compact_section_data(section_data)
+        
         return self.formatter.format_section(section_content, template_type)
     
-    def generate_recommendations_content(self, data: Dict[str, Any], template_type: str) -> Dict[str, Any]:
-        """Generate recommendations content"""
-        recommendations = data.get('recommendations', [])
-        risk_level = self._extract_risk_level(data)
+    @staticmethod
+    def _compact_section_data(section_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy the top-level scalar fields of a section; nested data is summarized by the findings"""
+        return {key: value for key, value in section_data.items() if isinstance(value, _SCALAR_TYPES)}
+    
+    @staticmethod
+    def _is_empty_section(section_data: Dict[str, Any]) -> bool:
+        """Check whether a section holds nothing beyond placeholders and empty values"""
+        for value in section_data.values():
+            if isinstance(value, str):
+                if value not in _PLACEHOLDER_VALUES:
+                    return False
+            elif value is not None and (not isinstance(value, (list, dict)) or value):
+                return False
+        return True
+    
+    def _empty_section_content(self, section_id: str, section_data: Dict[str, Any],
+                               template_type: str) -> Dict[str, Any]:
+        """Build placeholder content for a section with no usable data, without the AI writer"""
+        overview = f"No {_pretty_key(section_id).lower()} data was available for this investigation."
+        analysis = "No significant findings identified in this category."
         
-        if template_type == 'basic':
-            content = "Based on the investigation findings, the following actions are recommended:\n\n"
-            for i, rec in enumerate(recommendations[:3], 1):
-                content += f"{i}. {rec}\n"
+        return self._format_section_content(section_id, section_data, template_type,
+                                            overview, analysis, [])
+    
+    def _generate_section_text(self, section_data: Dict[str, Any], section_id: str,
+                               template_type: str) -> Tuple[str, str, Tuple[str, ...]]:
+        """Generate the overview, analysis and key findings for one section"""
+        # Generate section overview
+        overview = self.ai_writer.write_section_overview(section_data, section_id, template_type)
         
-        elif template_type == 'standard':
-            content = f"""
-            Based on the comprehensive investigation and {risk_level} risk assessment, 
-            the following recommendations are provided to address identified risks and 
-            enhance security posture:
-            
-            """
-            
-            for i, rec in enumerate(recommendations[:5], 1):
-                content += f"{i}. {rec}\n\n"
+        # Generate detailed analysis
+        analysis = self.ai_writer.analyze_findings(section_data, section_id, template_type)
         
-        elif template_type == 'professional':
-            content = f"""
-            STRATEGIC RECOMMENDATIONS
-            
-            Based on the detailed multi-source analysis and comprehensive risk assessment 
-            indicating a {risk_level} risk profile, the following strategic recommendations 
-            are provided to address identified vulnerabilities and enhance overall security posture:
-            
-            """
-            
-            for i, rec in enumerate(recommendations[:8], 1):
-                content += f"Recommendation {i}: {rec}\n\n"
-                content += f"Priority: {'High' if i <= 3 else 'Medium'}\n"
-                content += f"Implementation Timeline: {'Immediate' if i <= 2 else '30-60 days'}\n\n"
+        # Extract key findings
+        findings = tuple(self._extract_section_findings(section_data))
         
-        else:  # forensic
-            content = f"""
-            EXPERT RECOMMENDATIONS AND LEGAL CONSIDERATIONS
-            
-            Based on the forensic investigation findings and comprehensive risk assessment 
-            indicating a {risk_level} risk classification, the following expert recommendations 
-            are provided with consideration for potential legal and regulatory implications:
-            
-            """
-            
-            for i, rec in enumerate(recommendations, 1):
-                content += f"Recommendation {i}: {rec}\n"
-                content += f"Legal Consideration: Review with legal counsel if implementing\n"
-                content += f"Evidence Support: Documented in investigation findings\n"
-                content += f"Risk Mitigation: {'Critical' if i <= 3 else 'Important'}\n\n"
+        return overview, analysis, findings
+    
+    def generate_recommendations_content(self, data: Dict[str, Any], template_type: str,
+                                         risk_level: Optional[str] = None) -> Dict[str, Any]:
+        """Generate recommendations content"""
+        recommendations = data.get('recommendations', [])
+        if risk_level is None:
+            risk_level = self._extract_risk_level(data)
+        
+        templates = _RECOMMENDATIONS_HEADER_TEMPLATES
+        header = templates.get(template_type, templates['forensic']).format(risk_level=risk_level)
+        writer = self._recommendation_writers.get(template_type, self._write_forensic_recommendations)
+        parts = [header, "\n\n"]
+        parts.extend(writer(recommendations))
         
         return {
-            'content': content,
+            'content': "".join(parts),
             'recommendations_count': len(recommendations),
             'risk_level': risk_level
         }
     
-    def generate_conclusion(self, data: Dict[str, Any], template_type: str) -> Dict[str, Any]:
+    def _write_basic_recommendations(self, recommendations: List[str]) -> List[str]:
+        """Write the top three recommendations as a numbered list"""
+        return [f"{i}. {rec}\n" for i, rec in enumerate(recommendations[:3], 1)]
+    
+    def _write_standard_recommendations(self, recommendations: List[str]) -> List[str]:
+        """Write the top five recommendations as a spaced numbered list"""
+        return [f"{i}. {rec}\n\n" for i, rec in enumerate(recommendations[:5], 1)]
+    
+    def _write_professional_recommendations(self, recommendations: List[str]) -> List[str]:
+        """Write up to eight recommendations with priority and timeline"""
+        return [
+            _PROFESSIONAL_RECOMMENDATION_ITEM.format(
+                number=i, recommendation=rec,
+                priority='High' if i <= 3 else 'Medium',
+                timeline='Immediate' if i <= 2 else '30-60 days'
+            )
+            for i, rec in enumerate(recommendations[:8], 1)
+        ]
+    
+    def _write_forensic_recommendations(self, recommendations: List[str]) -> List[str]:
+        """Write every recommendation with legal and evidence notes"""
+        return [
+            _FORENSIC_RECOMMENDATION_ITEM.format(
+                number=i, recommendation=rec,
+                mitigation='Critical' if i <= 3 else 'Important'
+            )
+            for i, rec in enumerate(recommendations, 1)
+        ]
+    
+    def generate_conclusion(self, data: Dict[str, Any], template_type: str,
+                            risk_level: Optional[str] = None) -> Dict[str, Any]:
         """Generate conclusion content"""
-        risk_level = self._extract_risk_level(data)
+        if risk_level is None:
+            risk_level = self._extract_risk_level(data)
         confidence = data.get('risk_assessment', {}).get('confidence', 0)
         
-        if template_type == 'basic':
-            content = f"""
-            This investigation determined a {risk_level} risk level with {confidence:.0%} confidence. 
-            The findings provide sufficient information for risk-based decision making.
-            """
-        
-        elif template_type == 'standard':
-            content = f"""
-            INVESTIGATION CONCLUSION
-            
-            This comprehensive investigation has determined a {risk_level} risk classification 
-            with {confidence:.0%} confidence based on multi-source analysis and cross-validation. 
-            The investigation successfully gathered and analyzed data from multiple authoritative 
-            sources to provide a thorough risk assessment.
-            
-            The findings indicate that appropriate risk management measures should be implemented 
-            based on the identified risk level and specific findings detailed throughout this report.
-            """
-        
-        elif template_type == 'professional':
-            content = f"""
-            EXECUTIVE CONCLUSION AND PROFESSIONAL ASSESSMENT
-            
-            This detailed investigation has concluded with a {risk_level} risk classification, 
-            supported by comprehensive multi-source analysis and validated through cross-reference 
-            protocols. The assessment confidence level of {confidence:.0%} reflects the quality 
-            and completeness of available data sources.
-            
-            The investigation methodology employed advanced artificial intelligence analysis, 
-            external database integration, and machine learning risk modeling to provide a 
-            thorough and objective assessment. All findings have been documented with appropriate 
-            source attribution and confidence levels.
-            
-            The risk classification and associated recommendations provide a solid foundation 
-            for informed decision-making and appropriate risk management implementation.
-            """
-        
-        else:  # forensic
-            content = f"""
-            FORENSIC CONCLUSION AND EXPERT OPINION
-            
-            Based on the comprehensive forensic investigation conducted in accordance with 
-            established investigative standards, this analysis concludes with a {risk_level} 
-            risk classification. The assessment confidence level of {confidence:.0%} is 
-            supported by documented evidence and verified data sources.
-            
-            EXPERT OPINION: The investigation methodology employed recognized forensic 
-            techniques and maintained appropriate evidence chain documentation. All findings 
-            are based on verifiable data sources and have been documented with sufficient 
-            detail to support potential legal or regulatory proceedings.
-            
-            The risk assessment and associated findings provide a professional foundation 
-            for risk-based decision making and potential legal considerations. All evidence 
-            and documentation have been preserved in accordance with forensic standards.
-            """
+        templates = _CONCLUSION_TEMPLATES
+        template = templates.get(template_type, templates['forensic'])
+        content = template.format(risk_level=risk_level, confidence=confidence)
         
         return {
             'content': content,
@@ -811,22 +1035,18 @@ class ReportContentGenerator:
     
     def _extract_section_findings(self, section_data: Dict[str, Any]) -> List[str]:
         """Extract key findings from section data"""
-        findings = []
+        return list(islice(self._iter_section_findings(section_data), 10))  # Limit to top 10 findings
+    
+    def _iter_section_findings(self, section_data: Dict[str, Any]) -> Iterator[str]:
+        """Yield findings from section data lazily, in field order"""
+        # Local aliases keep global and attribute lookups out of the per-field loop
+        handler_for = _FINDING_HANDLERS.get
+        subclass_handler_for = _subclass_finding_handler
         
         for key, value in section_data.items():
-            if isinstance(value, str) and value and value not in ['Unknown', 'Not available', 'Not checked']:
-                findings.append(f"{key.replace('_', ' ').title()}: {value}")
-            elif isinstance(value, (int, float)) and value > 0:
-                findings.append(f"{key.replace('_', ' ').title()}: {value}")
-            elif isinstance(value, list) and value:
-                findings.append(f"{key.replace('_', ' ').title()}: {len(value)} items")
-            elif isinstance(value, dict) and value:
-                # Handle nested dictionaries
-                for sub_key, sub_value in value.items():
-                    if isinstance(sub_value, str) and sub_value and sub_value != 'Unknown':
-                        findings.append(f"{sub_key.replace('_', ' ').title()}: {sub_value}")
-        
-        return findings[:10]  # Limit to top 10 findings
+            handler = handler_for(type(value)) or subclass_handler_for(value)
+            if handler is not None:
+                yield from handler(key, value)
     
     def _extract_risk_level(self, data: Dict[str, Any]) -> str:
         """Extract risk level from data"""
@@ -907,8 +1127,11 @@ if __name__ == "__main__":
             
             # Save sample content
             output_file = Path(__file__).parent / f"test_{template_type}_content.json"
-            with open(output_file, 'w') as f:
-                json.dump(content, f, indent=2, default=str)
+            if ORJSON_AVAILABLE:
+                output_file.write_bytes(orjson.dumps(content, option=orjson.OPT_INDENT_2, default=str))
+            else:
+                with open(output_file, 'w', buffering=1 << 16) as f:
+                    json.dump(content, f, indent=2, default=str)
             
             print(f"  💾 Content saved to: {output_file}")
         
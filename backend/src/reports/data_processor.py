@@ -9,13 +9,50 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
-import statistics
+from functools import lru_cache
 import re
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _fast_mean(values: List[float]) -> float:
+    """Arithmetic mean of a short list of floats (0.0 when empty)"""
+    return sum(values) / len(values) if values else 0.0
+
+@lru_cache(maxsize=512)
+def _pretty_key(key: str) -> str:
+    """Title-case a snake_case agent, model or finding key for display"""
+    return key.replace('_', ' ').title()
+
+# Case-insensitive finding phrases checked by the risk scorers
+_IDENTITY_PATTERNS = {
+    'criminal': re.compile(r'criminal records found', re.IGNORECASE),
+    'social_media': re.compile(r'no social media', re.IGNORECASE),
+}
+_FINANCIAL_PATTERNS = {
+    'transactions': re.compile(r'suspicious', re.IGNORECASE),
+}
+_DIGITAL_PATTERNS = {
+    'domain_age': re.compile(r'recent registration', re.IGNORECASE),
+}
+_COMPLIANCE_PATTERNS = {
+    'sanctions': re.compile(r'matches found', re.IGNORECASE),
+    'pep': re.compile(r'politically exposed person', re.IGNORECASE),
+    'watchlist': re.compile(r'matches', re.IGNORECASE),
+    'adverse_media': re.compile(r'negative media', re.IGNORECASE),
+}
+_THREAT_PATTERNS = {
+    'incidents': re.compile(r'incidents found', re.IGNORECASE),
+    'malware': re.compile(r'malware connections', re.IGNORECASE),
+}
+
 class RiskLevel(Enum):
     """Risk level enumeration"""
     LOW = "LOW"
@@ -29,6 +66,17 @@ class ComplianceStatus(Enum):
     REVIEW = "REVIEW"
     BLOCKED = "BLOCKED"
 
+@dataclass
+class ScanStats:
+    """Per-section statistics gathered in a single pass over investigation data"""
+    missing: List[Tuple[str, Optional[str]]]
+    present_fields: int
+    total_fields: int
+    api_success_rate: Optional[float]
+    failed_apis: List[str]
+    ml_confidences: List[float]
+    low_conf_types: List[str]
+
 @dataclass
 class ValidationResult:
     """Data validation result"""
@@ -37,6 +85,7 @@ class ValidationResult:
     warnings: List[str]
     completeness_score: float
     quality_score: float
+    scan_stats: Optional[ScanStats] = None
 
 @dataclass
 class RiskAssessment:
@@ -102,100 +151,108 @@ class DataValidator:
     
     def validate(self, data: Dict[str, Any]) -> ValidationResult:
         """Validate investigation data"""
-        errors = []
-        warnings = []
+        stats = self.scan_stats(data)
         
         # Check required fields
-        for section, fields in self.required_fields.items():
-            if section not in data:
-                errors.append(f"Missing required section: {section}")
-                continue
-            
-            for field in fields:
-                if field not in data[section]:
-                    errors.append(f"Missing required field: {section}.{field}")
+        errors = [
+            f"Missing required section: {section}" if field is None
+            else f"Missing required field: {section}.{field}"
+            for section, field in stats.missing
+        ]
         
         # Validate data quality
-        quality_issues = self._validate_data_quality(data)
-        warnings.extend(quality_issues)
+        warnings = self._validate_data_quality(stats)
         
         # Calculate scores
-        completeness_score = self._calculate_completeness(data)
-        quality_score = self._calculate_quality(data)
+        completeness_score = self._calculate_completeness(stats)
+        quality_score = self._calculate_quality(data, stats)
         
         return ValidationResult(
             is_valid=len(errors) == 0,
             errors=errors,
             warnings=warnings,
             completeness_score=completeness_score,
-            quality_score=quality_score
+            quality_score=quality_score,
+            scan_stats=stats
         )
     
-    def _validate_data_quality(self, data: Dict[str, Any]) -> List[str]:
-        """Validate data quality issues"""
-        warnings = []
-        
-        # Check API response success rates
-        api_responses = data.get('api_responses', {})
-        failed_apis = [api for api, response in api_responses.items() 
-                      if response.get('status') != 'success']
+    def scan_stats(self, data: Dict[str, Any]) -> ScanStats:
+        """Walk the required fields, API responses and ML predictions once"""
+        missing = []
+        total_fields = 0
+        present_fields = 0
         
-        if failed_apis:
-            warnings.append(f"Failed API calls: {', '.join(failed_apis)}")
+        for section, fields in self.required_fields.items():
+            total_fields += len(fields)
+            if section not in data:
+                missing.append((section, None))
+                continue
+            
+            section_data = data[section]
+            for field in fields:
+                if field in section_data:
+                    present_fields += 1
+                else:
+                    missing.append((section, field))
         
-        # Check ML prediction confidence
-        ml_predictions = data.get('ml_predictions', {})
-        low_confidence_predictions = []
+        # API response success rates
+        api_responses = data.get('api_responses', {})
+        failed_apis = [api for api, response in api_responses.items()
+                       if response.get('status') != 'success']
+        api_success_rate = None
+        if api_responses:
+            api_success_rate = (len(api_responses) - len(failed_apis)) / len(api_responses)
         
-        for prediction_type, prediction in ml_predictions.items():
+        # ML prediction confidence
+        ml_confidences = []
+        low_conf_types = []
+        for prediction_type, prediction in data.get('ml_predictions', {}).items():
             if isinstance(prediction, dict) and 'prediction' in prediction:
                 confidence = prediction['prediction'].get('confidence', 0)
+                ml_confidences.append(confidence)
                 if confidence < 0.7:
-                    low_confidence_predictions.append(prediction_type)
+                    low_conf_types.append(prediction_type)
+        
+        return ScanStats(
+            missing=missing,
+            present_fields=present_fields,
+            total_fields=total_fields,
+            api_success_rate=api_success_rate,
+            failed_apis=failed_apis,
+            ml_confidences=ml_confidences,
+            low_conf_types=low_conf_types
+        )
+    
+    def _validate_data_quality(self, stats: ScanStats) -> List[str]:
+        """Validate data quality issues"""
+        warnings = []
+        
+        if stats.failed_apis:
+            warnings.append(f"Failed API calls: {', '.join(stats.failed_apis)}")
         
-        if low_confidence_predictions:
-            warnings.append(f"Low confidence ML predictions: {', '.join(low_confidence_predictions)}")
+        if stats.low_conf_types:
+            warnings.append(f"Low confidence ML predictions: {', '.join(stats.low_conf_types)}")
         
         return warnings
     
-    def _calculate_completeness(self, data: Dict[str, Any]) -> float:
+    def _calculate_completeness(self, stats: ScanStats) -> float:
         """Calculate data completeness score"""
-        total_fields = 0
-        present_fields = 0
-        
-        for section, fields in self.required_fields.items():
-            total_fields += len(fields)
-            if section in data:
-                for field in fields:
-                    if field in data[section]:
-                        present_fields += 1
-        
-        return present_fields / total_fields if total_fields > 0 else 0.0
+        if stats.total_fields > 0:
+            return stats.present_fields / stats.total_fields
+        return 0.0
     
-    def _calculate_quality(self, data: Dict[str, Any]) -> float:
+    def _calculate_quality(self, data: Dict[str, Any], stats: ScanStats) -> float:
         """Calculate data quality score"""
         quality_factors = []
         
         # API success rate
-        api_responses = data.get('api_responses', {})
-        if api_responses:
-            successful_apis = sum(1 for response in api_responses.values() 
-                                if response.get('status') == 'success')
-            api_success_rate = successful_apis / len(api_responses)
-            quality_factors.append(api_success_rate)
+        if stats.api_success_rate is not None:
+            quality_factors.append(stats.api_success_rate)
         
         # ML confidence average
-        ml_predictions = data.get('ml_predictions', {})
-        if ml_predictions:
-            confidences = []
-            for prediction in ml_predictions.values():
-                if isinstance(prediction, dict) and 'prediction' in prediction:
-                    confidence = prediction['prediction'].get('confidence', 0)
-                    confidences.append(confidence)
-            
-            if confidences:
-                avg_confidence = statistics.mean(confidences)
-                quality_factors.append(avg_confidence)
+        if stats.ml_confidences:
+            avg_confidence = _fast_mean(stats.ml_confidences)
+            quality_factors.append(avg_confidence)
         
         # Data freshness (assume recent data is higher quality)
         metadata = data.get('metadata', {})
@@ -204,12 +261,13 @@ class DataValidator:
             # Simple freshness score (1.0 for recent data)
             quality_factors.append(0.95)  # Assume good freshness
         
-        return statistics.mean(quality_factors) if quality_factors else 0.5
+        return _fast_mean(quality_factors) if quality_factors else 0.5
 
 class RiskScorer:
     """Calculates comprehensive risk scores and assessments"""
     
-    def __init__(self):
+    def __init__(self, validator: Optional[DataValidator] = None):
+        self.validator = validator or DataValidator()
         self.risk_weights = {
             'identity_risk': 0.25,
             'financial_risk': 0.30,
@@ -217,27 +275,38 @@ class RiskScorer:
             'compliance_risk': 0.15,
             'threat_risk': 0.10
         }
+        self._factor_order = tuple(self.risk_weights)
+        if NUMPY_AVAILABLE:
+            self._weights = np.fromiter(self.risk_weights.values(), dtype=np.float64)
+        else:
+            self._weights = tuple(self.risk_weights.values())
     
-    def calculate_comprehensive_risk_assessment(self, data: Dict[str, Any]) -> RiskAssessment:
-        """Calculate comprehensive risk assessment"""
-        
-        # Calculate individual risk factors
-        risk_factors = {
-            'identity_risk': self.score_identity_risk(data),
-            'financial_risk': self.score_financial_risk(data),
-            'digital_risk': self.score_digital_risk(data),
-            'compliance_risk': self.score_compliance_risk(data),
-            'threat_risk': self.score_threat_risk(data)
-        }
+    def calculate_comprehensive_risk_assessment(self, data: Dict[str, Any],
+                                               validation_result: Optional[ValidationResult] = None) -> RiskAssessment:
+        """Calculate comprehensive risk assessment
+        
+        Callers that already validated ``data`` pass ``validation_result`` so
+        the confidence calculation reuses it instead of validating again.
+        """
+        
+        # Calculate individual risk factors, in the same order as the weights
+        scores = [
+            self.score_identity_risk(data),
+            self.score_financial_risk(data),
+            self.score_digital_risk(data),
+            self.score_compliance_risk(data),
+            self.score_threat_risk(data)
+        ]
+        risk_factors = dict(zip(self._factor_order, scores))
         
         # Calculate weighted overall score
-        overall_score = self.calculate_weighted_score(risk_factors)
+        overall_score = self._weighted_sum(scores)
         
         # Determine risk level
         risk_level = self.determine_risk_level(overall_score)
         
         # Calculate confidence
-        confidence = self.calculate_confidence(data)
+        confidence = self.calculate_confidence(data, validation_result)
         
         # Identify risk indicators
         risk_indicators = self.identify_risk_indicators(data, risk_factors)
@@ -268,7 +337,7 @@ class RiskScorer:
         
         # Criminal background
         criminal_bg = findings.get('criminal_background', '')
-        if 'criminal records found' in criminal_bg.lower():
+        if _IDENTITY_PATTERNS['criminal'].search(criminal_bg):
             risk_score += 0.4
         
         # Address history
@@ -280,7 +349,7 @@ class RiskScorer:
         
         # Social media presence
         social_media = findings.get('social_media_presence', '')
-        if 'no social media' in social_media.lower():
+        if _IDENTITY_PATTERNS['social_media'].search(social_media):
             risk_score += 0.1
         
         return min(risk_score, 1.0)
@@ -306,7 +375,7 @@ class RiskScorer:
         
         # Transaction patterns
         transaction_patterns = findings.get('transaction_patterns', '')
-        if 'suspicious' in transaction_patterns.lower():
+        if _FINANCIAL_PATTERNS['transactions'].search(transaction_patterns):
             risk_score += 0.3
         
         # ML financial risk score
@@ -327,7 +396,7 @@ class RiskScorer:
         
         # Domain age
         domain_age = domain_findings.get('domain_age', '')
-        if 'recent registration' in domain_age.lower():
+        if _DIGITAL_PATTERNS['domain_age'].search(domain_age):
             risk_score += 0.3
         
         # Risk indicators
@@ -360,22 +429,22 @@ class RiskScorer:
         
         # Sanctions screening
         sanctions_status = findings.get('sanctions_screening', '')
-        if 'matches found' in sanctions_status.lower():
+        if _COMPLIANCE_PATTERNS['sanctions'].search(sanctions_status):
             risk_score += 0.8
         
         # PEP screening
         pep_status = findings.get('pep_screening', '')
-        if 'politically exposed person' in pep_status.lower():
+        if _COMPLIANCE_PATTERNS['pep'].search(pep_status):
             risk_score += 0.6
         
         # Watchlist screening
         watchlist_status = findings.get('watchlist_screening', '')
-        if 'matches' in watchlist_status.lower():
+        if _COMPLIANCE_PATTERNS['watchlist'].search(watchlist_status):
             risk_score += 0.7
         
         # Adverse media
         adverse_media = findings.get('adverse_media', '')
-        if 'negative media' in adverse_media.lower():
+        if _COMPLIANCE_PATTERNS['adverse_media'].search(adverse_media):
             risk_score += 0.4
         
         # OpenSanctions API results
@@ -405,12 +474,12 @@ class RiskScorer:
         
         # Security incidents
         security_incidents = findings.get('security_incidents', '')
-        if 'incidents found' in security_incidents.lower():
+        if _THREAT_PATTERNS['incidents'].search(security_incidents):
             risk_score += 0.6
         
         # Malware associations
         malware_associations = findings.get('malware_associations', '')
-        if 'malware connections' in malware_associations.lower():
+        if _THREAT_PATTERNS['malware'].search(malware_associations):
             risk_score += 0.7
         
         # Shodan infrastructure analysis
@@ -424,11 +493,14 @@ class RiskScorer:
     
     def calculate_weighted_score(self, risk_factors: Dict[str, float]) -> float:
         """Calculate weighted overall risk score"""
-        weighted_score = 0.0
-        
-        for factor, score in risk_factors.items():
-            weight = self.risk_weights.get(factor, 0.0)
-            weighted_score += score * weight
+        return self._weighted_sum([risk_factors.get(factor, 0.0) for factor in self._factor_order])
+    
+    def _weighted_sum(self, scores: List[float]) -> float:
+        """Weight scores given in risk factor order and cap the total at 1.0"""
+        if NUMPY_AVAILABLE:
+            weighted_score = float(np.asarray(scores, dtype=np.float64) @ self._weights)
+        else:
+            weighted_score = sum(score * weight for score, weight in zip(scores, self._weights))
         
         return min(weighted_score, 1.0)
     
@@ -443,38 +515,29 @@ class RiskScorer:
         else:
             return RiskLevel.LOW
     
-    def calculate_confidence(self, data: Dict[str, Any]) -> float:
+    def calculate_confidence(self, data: Dict[str, Any],
+                             validation_result: Optional[ValidationResult] = None) -> float:
         """Calculate confidence in risk assessment"""
         confidence_factors = []
         
         # Data completeness
-        validator = DataValidator()
-        validation_result = validator.validate(data)
+        if validation_result is None:
+            validation_result = self.validator.validate(data)
         confidence_factors.append(validation_result.completeness_score)
         confidence_factors.append(validation_result.quality_score)
         
-        # ML prediction confidence
-        ml_predictions = data.get('ml_predictions', {})
-        ml_confidences = []
-        
-        for prediction in ml_predictions.values():
-            if isinstance(prediction, dict) and 'prediction' in prediction:
-                confidence = prediction['prediction'].get('confidence', 0)
-                ml_confidences.append(confidence)
+        stats = validation_result.scan_stats or self.validator.scan_stats(data)
         
-        if ml_confidences:
-            avg_ml_confidence = statistics.mean(ml_confidences)
+        # ML prediction confidence
+        if stats.ml_confidences:
+            avg_ml_confidence = _fast_mean(stats.ml_confidences)
             confidence_factors.append(avg_ml_confidence)
         
         # API success rate
-        api_responses = data.get('api_responses', {})
-        if api_responses:
-            successful_apis = sum(1 for response in api_responses.values() 
-                                if response.get('status') == 'success')
-            api_success_rate = successful_apis / len(api_responses)
-            confidence_factors.append(api_success_rate)
+        if stats.api_success_rate is not None:
+            confidence_factors.append(stats.api_success_rate)
         
-        return statistics.mean(confidence_factors) if confidence_factors else 0.5
+        return _fast_mean(confidence_factors) if confidence_factors else 0.5
     
     def identify_risk_indicators(self, data: Dict[str, Any], risk_factors: Dict[str, float]) -> List[str]:
         """Identify specific risk indicators"""
@@ -549,33 +612,36 @@ class EvidenceChainBuilder:
     """Builds comprehensive evidence chain for investigations"""
     
     def build_evidence_chain(self, data: Dict[str, Any]) -> List[EvidenceItem]:
-        """Build complete evidence chain from investigation data"""
+        """Build complete evidence chain from investigation data
+        
+        Every item is stamped with the same build time, so the chain keeps
+        its source order (agents, then APIs, then ML models).
+        """
         evidence_chain = []
+        now = datetime.now()
         
         # CrewAI agent evidence
         crew_results = data.get('crew_results', {})
         for agent_type, results in crew_results.items():
-            evidence_items = self._extract_crew_evidence(agent_type, results)
+            evidence_items = self._extract_crew_evidence(agent_type, results, now)
             evidence_chain.extend(evidence_items)
         
         # API response evidence
         api_responses = data.get('api_responses', {})
         for api_name, response in api_responses.items():
-            evidence_items = self._extract_api_evidence(api_name, response)
+            evidence_items = self._extract_api_evidence(api_name, response, now)
             evidence_chain.extend(evidence_items)
         
         # ML prediction evidence
         ml_predictions = data.get('ml_predictions', {})
         for prediction_type, prediction in ml_predictions.items():
-            evidence_items = self._extract_ml_evidence(prediction_type, prediction)
+            evidence_items = self._extract_ml_evidence(prediction_type, prediction, now)
             evidence_chain.extend(evidence_items)
         
-        # Sort by timestamp
-        evidence_chain.sort(key=lambda x: x.timestamp, reverse=True)
-        
         return evidence_chain
     
-    def _extract_crew_evidence(self, agent_type: str, results: Dict[str, Any]) -> List[EvidenceItem]:
+    def _extract_crew_evidence(self, agent_type: str, results: Dict[str, Any],
+                               now: datetime) -> List[EvidenceItem]:
         """Extract evidence from CrewAI agent results"""
         evidence_items = []
         
@@ -586,7 +652,7 @@ class EvidenceChainBuilder:
         risk_assessment = results.get('risk_assessment', {})
         
         # Main finding
-        agent_name = results.get('agent', agent_type.replace('_', ' ').title())
+        agent_name = results['agent'] if 'agent' in results else _pretty_key(agent_type)
         risk_level = risk_assessment.get('level', 'UNKNOWN')
         confidence = risk_assessment.get('confidence', 0.5)
         
@@ -595,7 +661,7 @@ class EvidenceChainBuilder:
             data_type="Agent Analysis",
             finding=f"Risk Level: {risk_level}",
             confidence=confidence,
-            timestamp=datetime.now(),
+            timestamp=now,
             verification_status="AI Analysis"
         ))
         
@@ -604,16 +670,17 @@ class EvidenceChainBuilder:
             if isinstance(value, (str, int, float)) and value:
                 evidence_items.append(EvidenceItem(
                     source=f"CrewAI {agent_name}",
-                    data_type=key.replace('_', ' ').title(),
+                    data_type=_pretty_key(key),
                     finding=str(value),
                     confidence=confidence,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     verification_status="AI Analysis"
                 ))
         
         return evidence_items
     
-    def _extract_api_evidence(self, api_name: str, response: Dict[str, Any]) -> List[EvidenceItem]:
+    def _extract_api_evidence(self, api_name: str, response: Dict[str, Any],
+                              now: datetime) -> List[EvidenceItem]:
         """Extract evidence from API responses"""
         evidence_items = []
         
@@ -633,7 +700,7 @@ class EvidenceChainBuilder:
                     data_type="Sanctions Screening",
                     finding=f"Found {len(sanctions_matches)} sanctions matches",
                     confidence=0.95,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     verification_status="External Database"
                 ))
             
@@ -643,7 +710,7 @@ class EvidenceChainBuilder:
                     data_type="PEP Screening",
                     finding=f"Found {len(pep_matches)} PEP matches",
                     confidence=0.95,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     verification_status="External Database"
                 ))
         
@@ -659,7 +726,7 @@ class EvidenceChainBuilder:
                         data_type="Domain Registration",
                         finding=f"Domain created: {creation_date}, Registrar: {registrar}",
                         confidence=0.90,
-                        timestamp=datetime.now(),
+                        timestamp=now,
                         verification_status="Registry Data"
                     ))
         
@@ -676,7 +743,7 @@ class EvidenceChainBuilder:
                     data_type="Infrastructure Analysis",
                     finding=f"Host location: {country}, Organization: {organization}",
                     confidence=0.85,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     verification_status="Network Scan"
                 ))
             
@@ -686,13 +753,14 @@ class EvidenceChainBuilder:
                     data_type="Security Vulnerabilities",
                     finding=f"Found {len(vulnerabilities)} vulnerabilities",
                     confidence=0.90,
-                    timestamp=datetime.now(),
+                    timestamp=now,
                     verification_status="Security Scan"
                 ))
         
         return evidence_items
     
-    def _extract_ml_evidence(self, prediction_type: str, prediction: Dict[str, Any]) -> List[EvidenceItem]:
+    def _extract_ml_evidence(self, prediction_type: str, prediction: Dict[str, Any],
+                             now: datetime) -> List[EvidenceItem]:
         """Extract evidence from ML predictions"""
         evidence_items = []
         
@@ -700,7 +768,7 @@ class EvidenceChainBuilder:
             return evidence_items
         
         pred_data = prediction['prediction']
-        model_name = prediction.get('model', prediction_type.replace('_', ' ').title())
+        model_name = prediction['model'] if 'model' in prediction else _pretty_key(prediction_type)
         
         fraud_prob = pred_data.get('fraud_probability') or pred_data.get('risk_probability', 0)
         risk_level = pred_data.get('risk_level', 'UNKNOWN')
@@ -711,7 +779,7 @@ class EvidenceChainBuilder:
             data_type="Machine Learning Prediction",
             finding=f"Risk Level: {risk_level}, Probability: {fraud_prob:.2f}",
             confidence=confidence,
-            timestamp=datetime.now(),
+            timestamp=now,
             verification_status="AI Prediction"
         ))
         
@@ -722,7 +790,7 @@ class ReportDataProcessor:
     
     def __init__(self):
         self.validator = DataValidator()
-        self.risk_scorer = RiskScorer()
+        self.risk_scorer = RiskScorer(self.validator)
         self.evidence_builder = EvidenceChainBuilder()
     
     def process_investigation_data(self, raw_data: Dict[str, Any]) -> ProcessedInvestigationData:
@@ -736,7 +804,9 @@ class ReportDataProcessor:
                 logger.warning(f"Data validation issues: {validation_result.errors}")
             
             # Calculate risk assessment
-            risk_assessment = self.risk_scorer.calculate_comprehensive_risk_assessment(raw_data)
+            risk_assessment = self.risk_scorer.calculate_comprehensive_risk_assessment(
+                raw_data, validation_result
+            )
             
             # Build evidence chain
             evidence_chain = self.evidence_builder.build_evidence_chain(raw_data)
@@ -791,7 +861,7 @@ class ReportDataProcessor:
             if results and 'risk_assessment' in results:
                 agent_risk = results['risk_assessment'].get('level', 'LOW')
                 if agent_risk in ['HIGH', 'CRITICAL']:
-                    agent_name = agent_type.replace('_', ' ').title()
+                    agent_name = _pretty_key(agent_type)
                     key_findings.append(f"{agent_name}: {agent_risk} risk identified")
         
         # Data source summary